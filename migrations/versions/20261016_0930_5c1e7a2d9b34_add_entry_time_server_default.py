@@ -0,0 +1,31 @@
+"""add entry_time server default
+
+Revision ID: 5c1e7a2d9b34
+Revises: 08892484eb4c
+Create Date: 2026-10-16 09:30:12.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7a2d9b34'
+down_revision: Union[str, None] = '08892484eb4c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column('agent_trades', 'entry_time',
+               existing_type=sa.DateTime(timezone=True),
+               server_default=sa.text('now()'),
+               existing_nullable=True)
+
+
+def downgrade() -> None:
+    op.alter_column('agent_trades', 'entry_time',
+               existing_type=sa.DateTime(timezone=True),
+               server_default=None,
+               existing_nullable=True)
@@ -9,6 +9,10 @@ from pydantic import BaseModel, Field, validator
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; parse() runs for every agent in every cycle
+_CODE_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_RAW_JSON_PATTERN = re.compile(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", re.DOTALL)
+
 
 class TradingDecision(BaseModel):
     """Trading decision from an AI agent.
@@ -229,14 +233,12 @@ class DecisionParser:
                 return potential_json.strip()
 
         # Fallback to code block extraction
-        code_block_pattern = r"```(?:json)?\s*(\{.*?\})\s*```"
-        match = re.search(code_block_pattern, text, re.DOTALL)
+        match = _CODE_BLOCK_PATTERN.search(text)
         if match:
             return match.group(1).strip()
 
         # Fallback to raw JSON object
-        json_pattern = r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}"
-        match = re.search(json_pattern, text, re.DOTALL)
+        match = _RAW_JSON_PATTERN.search(text)
         if match:
             return match.group(0).strip()
 
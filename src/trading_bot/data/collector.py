@@ -31,6 +31,8 @@ class DataCollector:
         self.client = HyperliquidClient(
             base_url=exchange_config.info_url,
             timeout=10,
+            # One allMids request serves every coin in a collection cycle
+            price_cache_ttl=2.0,
         )
         self.indicators_calculator = TechnicalIndicators()
 
@@ -1,6 +1,7 @@
 """HyperLiquid API client for fetching market data."""
 
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import requests
@@ -15,19 +16,27 @@ logger = logging.getLogger(__name__)
 class HyperliquidClient:
     """Client for HyperLiquid Info API."""
 
-    def __init__(self, base_url: str, timeout: int = 10):
+    def __init__(
+        self, base_url: str, timeout: int = 10, price_cache_ttl: float = 0
+    ):
         """
         Initialize HyperLiquid client.
 
         Args:
             base_url: Base URL for API (mainnet or testnet)
             timeout: Request timeout in seconds
+            price_cache_ttl: Seconds to reuse the last get_all_prices()
+                result; 0 (the default) disables the cache
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.price_cache_ttl = price_cache_ttl
         self.session = requests.Session()
         self.session.headers.update({"Content-Type": "application/json"})
 
+        self._prices_cache: Optional[Dict[str, Price]] = None
+        self._prices_cached_at = 0.0
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -56,10 +65,16 @@ class HyperliquidClient:
             logger.error(f"API request failed: {e}")
             raise
 
-    def get_all_prices(self) -> Dict[str, Price]:
+    def get_all_prices(self, force_refresh: bool = False) -> Dict[str, Price]:
         """
         Get current prices for all available coins.
 
+        When ``price_cache_ttl`` is set, results are reused for that many
+        seconds, so several lookups in the same cycle cost a single request.
+
+        Args:
+            force_refresh: Skip the cache and always call the API
+
         Returns:
             Dictionary mapping coin symbol to Price object
 
@@ -69,6 +84,13 @@ class HyperliquidClient:
             ...
         ]
         """
+        if (
+            not force_refresh
+            and self._prices_cache is not None
+            and time.monotonic() - self._prices_cached_at < self.price_cache_ttl
+        ):
+            return dict(self._prices_cache)
+
         payload = {"type": "allMids"}
 
         try:
@@ -103,7 +125,9 @@ class HyperliquidClient:
                         logger.warning(f"Failed to parse price item: {e}")
 
             logger.info(f"Fetched prices for {len(prices)} coins")
-            return prices
+            self._prices_cache = prices
+            self._prices_cached_at = time.monotonic()
+            return dict(prices)
 
         except Exception as e:
             logger.error(f"Failed to fetch prices: {e}")
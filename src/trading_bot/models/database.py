@@ -244,7 +244,7 @@ class AgentTrade(Base):
     size: Mapped[Decimal] = mapped_column(DECIMAL(20, 8), nullable=False)
     entry_price: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(20, 2))
     entry_time: Mapped[Optional[datetime]] = mapped_column(
-        DateTime(timezone=True), index=True
+        DateTime(timezone=True), server_default=func.now(), index=True
     )
     exit_price: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(20, 2))
     exit_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
@@ -5,6 +5,7 @@ import logging
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+from sqlalchemy import insert, inspect as sa_inspect
 from sqlalchemy.orm import Session
 
 from src.trading_bot.models.database import TradingAgent, AgentDecision
@@ -150,7 +151,7 @@ class MultiAgentOrchestrator:
         # Wait for all agents to complete
         results = await asyncio.gather(*agent_tasks, return_exceptions=True)
 
-        # Process results and save to database
+        # Process results
         all_decisions = []
         for agent, result in zip(agents, results):
             if isinstance(result, Exception):
@@ -165,6 +166,10 @@ class MultiAgentOrchestrator:
             elif result is not None:
                 all_decisions.append(result)
 
+        # Save to database in a worker thread so the blocking commit does
+        # not stall the event loop
+        all_decisions = await asyncio.to_thread(self._save_decisions, all_decisions)
+
         # Log cycle summary
         cycle_duration = (datetime.utcnow() - cycle_start).total_seconds()
         successful_decisions = [d for d in all_decisions if d.status == "success"]
@@ -307,7 +312,7 @@ class MultiAgentOrchestrator:
             duration_ms: Decision duration in milliseconds
 
         Returns:
-            AgentDecision object (saved to database)
+            AgentDecision object (not yet saved)
         """
         agent_decision = AgentDecision(
             agent_id=agent.id,
@@ -328,13 +333,6 @@ class MultiAgentOrchestrator:
             error_message=None
         )
 
-        with self.db_manager.session_scope() as session:
-            session.add(agent_decision)
-            # Commit handled by session_scope
-            session.flush()
-            session.refresh(agent_decision)
-            session.expunge(agent_decision)
-
         return agent_decision
 
     def _create_failed_decision(
@@ -351,7 +349,7 @@ class MultiAgentOrchestrator:
             prompt_content: Full prompt sent to LLM (optional)
 
         Returns:
-            AgentDecision object (saved to database)
+            AgentDecision object (not yet saved)
         """
         agent_decision = AgentDecision(
             agent_id=agent.id,
@@ -371,14 +369,39 @@ class MultiAgentOrchestrator:
             error_message=error_message
         )
 
+        return agent_decision
+
+    def _save_decisions(self, decisions: List[AgentDecision]) -> List[AgentDecision]:
+        """Save a cycle's decisions to the database with a single INSERT.
+
+        The rows go out as one executemany batch and RETURNING loads the
+        stored records back, so no per-decision flush or refresh is needed.
+
+        Args:
+            decisions: Unsaved decisions created during the cycle
+
+        Returns:
+            The saved AgentDecision objects, detached from the session
+        """
+        if not decisions:
+            return []
+
+        columns = sa_inspect(AgentDecision).column_attrs.keys()
+        rows = [
+            {key: getattr(decision, key) for key in columns if key in decision.__dict__}
+            for decision in decisions
+        ]
+
         with self.db_manager.session_scope() as session:
-            session.add(agent_decision)
             # Commit handled by session_scope
-            session.flush()
-            session.refresh(agent_decision)
-            session.expunge(agent_decision)
-
-        return agent_decision
+            saved = session.scalars(
+                insert(AgentDecision).returning(AgentDecision, sort_by_parameter_order=True),
+                rows,
+            ).all()
+            for decision in saved:
+                session.expunge(decision)
+
+        return saved
 
     def _summarize_actions(self, decisions: List[AgentDecision]) -> str:
         """Summarize actions from decisions.
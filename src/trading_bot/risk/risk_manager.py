@@ -19,7 +19,7 @@ from sqlalchemy.orm import Session
 from ..infrastructure.database import DatabaseManager
 from ..models.database import TradingAgent
 from ..trading.position_manager import PositionManager
-from ..trading.hyperliquid_executor import HyperLiquidExecutor
+from ..trading.hyperliquid_executor import ExchangeSnapshot, HyperLiquidExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +65,8 @@ class RiskManager:
         size_usd: Decimal,
         leverage: int,
         executor: Optional[HyperLiquidExecutor] = None,
-        session: Optional[Session] = None
+        session: Optional[Session] = None,
+        snapshot: Optional[ExchangeSnapshot] = None
     ) -> Tuple[bool, Optional[str]]:
         """Validate trade against risk rules.
 
@@ -76,16 +77,17 @@ class RiskManager:
             leverage: Leverage to use
             executor: Specific executor to use
             session: Optional database session
+            snapshot: Pre-fetched exchange state passed to account valuation
         """
         # pylint: disable=too-many-positional-arguments
         if session:
             return self._validate_trade_internal(
-                agent_id, coin, size_usd, leverage, executor, session
+                agent_id, coin, size_usd, leverage, executor, session, snapshot
             )
 
         with self.db_manager.session_scope() as local_session:
             return self._validate_trade_internal(
-                agent_id, coin, size_usd, leverage, executor, local_session
+                agent_id, coin, size_usd, leverage, executor, local_session, snapshot
             )
 
     def _validate_trade_internal(
@@ -95,11 +97,12 @@ class RiskManager:
         size_usd: Decimal,
         leverage: int,
         executor: Optional[HyperLiquidExecutor],
-        session: Session
+        session: Session,
+        snapshot: Optional[ExchangeSnapshot] = None
     ) -> Tuple[bool, Optional[str]]:
         # pylint: disable=too-many-positional-arguments
         # Get agent configuration
-        agent = session.query(TradingAgent).filter_by(id=agent_id).first()
+        agent = session.get(TradingAgent, agent_id)
 
         if not agent:
             logger.error("Agent not found: %s", agent_id)
@@ -108,7 +111,7 @@ class RiskManager:
         # Get account info
         try:
             account = self.position_manager.get_account_value(
-                agent_id, executor=executor, session=session
+                agent_id, executor=executor, session=session, snapshot=snapshot
             )
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.error("Failed to get account value: %s", e)
@@ -303,7 +306,7 @@ class RiskManager:
         session: Session
     ) -> Decimal:
         # pylint: disable=unused-argument
-        agent = session.query(TradingAgent).filter_by(id=agent_id).first()
+        agent = session.get(TradingAgent, agent_id)
         if not agent:
             logger.error("Agent not found: %s", agent_id)
             return Decimal("0")
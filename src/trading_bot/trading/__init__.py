@@ -1,13 +1,14 @@
 """Trading execution module (Phase 3)."""
 
 from .hyperliquid_signer import HyperLiquidSigner
-from .hyperliquid_executor import HyperLiquidExecutor
+from .hyperliquid_executor import ExchangeSnapshot, HyperLiquidExecutor
 from .order_manager import OrderManager, OrderSide
 from .position_manager import PositionManager
 from .trading_orchestrator import TradingOrchestrator
 
 __all__ = [
     "HyperLiquidSigner",
+    "ExchangeSnapshot",
     "HyperLiquidExecutor",
     "OrderManager",
     "OrderSide",
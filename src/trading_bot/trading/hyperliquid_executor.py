@@ -8,6 +8,7 @@ Official SDK: https://github.com/hyperliquid-dex/hyperliquid-python-sdk
 
 import logging
 import time
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -24,6 +25,13 @@ class OrderType:  # pylint: disable=too-few-public-methods
     MARKET = "market"
 
 
+@dataclass
+class ExchangeSnapshot:
+    """Exchange state fetched once and shared by the steps of one trade."""
+    user_state: Dict[str, Any] = field(default_factory=dict)  # Empty in dry-run
+    mid_prices: Dict[str, float] = field(default_factory=dict)
+
+
 class HyperLiquidExecutor:  # pylint: disable=too-many-instance-attributes
     """Execute trades on HyperLiquid Exchange using official SDK.
 
@@ -151,6 +159,23 @@ class HyperLiquidExecutor:  # pylint: disable=too-many-instance-attributes
         """
         return self.wallet_address
 
+    def snapshot(self) -> ExchangeSnapshot:
+        """Fetch user state and mid prices in one pass.
+
+        Risk validation, account valuation and position sizing all need the
+        same exchange state; sharing a snapshot avoids one REST round-trip
+        per step.
+
+        Returns:
+            ExchangeSnapshot for this executor's wallet
+        """
+        user_state = {} if self.dry_run else self.info.user_state(self.wallet_address)
+        all_mids = self.info.all_mids()
+        return ExchangeSnapshot(
+            user_state=user_state,
+            mid_prices={coin: float(px) for coin, px in all_mids.items()}
+        )
+
     def get_supported_assets(self) -> List[str]:
         """Get list of supported trading assets.
 
@@ -14,6 +14,7 @@ from enum import Enum
 from typing import Dict, List, Optional, Tuple, Any
 from uuid import UUID
 
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
 from ..infrastructure.database import DatabaseManager
@@ -183,7 +184,7 @@ class OrderManager:
         session: Session
     ) -> Tuple[bool, Optional[str]]:
         """Internal implementation of cancel_trade."""
-        trade = session.query(AgentTrade).filter_by(id=trade_id).first()
+        trade = session.get(AgentTrade, trade_id)
 
         if not trade:
             return False, "Trade not found"
@@ -258,7 +259,7 @@ class OrderManager:
     ) -> Tuple[bool, Optional[str]]:
         """Internal implementation of close_trade."""
         # pylint: disable=too-many-positional-arguments
-        trade = session.query(AgentTrade).filter_by(id=trade_id).first()
+        trade = session.get(AgentTrade, trade_id)
 
         if not trade:
             return False, "Trade not found"
@@ -294,10 +295,10 @@ class OrderManager:
             AgentTrade object or None if not found
         """
         if session:
-            return session.query(AgentTrade).filter_by(id=trade_id).first()
+            return session.get(AgentTrade, trade_id)
 
         with self.db_manager.session_scope() as local_session:
-            trade = local_session.query(AgentTrade).filter_by(id=trade_id).first()
+            trade = local_session.get(AgentTrade, trade_id)
             if trade:
                 local_session.expunge(trade)
             return trade
@@ -436,24 +437,25 @@ class OrderManager:
         agent_id: UUID,
         session: Session
     ) -> Dict[str, Any]:
-        all_trades = session.query(AgentTrade).filter_by(agent_id=agent_id).all()
-
-        total_trades = len(all_trades)
-        open_trades = sum(1 for t in all_trades if t.status == "open")
-        closed_trades = sum(1 for t in all_trades if t.status == "closed")
-        cancelled_trades = sum(1 for t in all_trades if t.status == "cancelled")
-
-        total_pnl = sum(
-            (t.realized_pnl or Decimal("0"))
-            for t in all_trades
-            if t.status == "closed"
-        )
-
-        total_fees = sum(
-            (t.fees or Decimal("0"))
-            for t in all_trades
-            if t.status == "closed"
-        )
+        # Aggregate in SQL and read a plain row: no ORM entities are materialized
+        is_closed = AgentTrade.status == "closed"
+        stmt = select(
+            func.count().label("total_trades"),
+            func.sum(case((AgentTrade.status == "open", 1), else_=0)).label("open_trades"),
+            func.sum(case((is_closed, 1), else_=0)).label("closed_trades"),
+            func.sum(case((AgentTrade.status == "cancelled", 1), else_=0)).label("cancelled_trades"),
+            func.sum(case((is_closed, AgentTrade.realized_pnl))).label("total_pnl"),
+            func.sum(case((is_closed, AgentTrade.fees))).label("total_fees"),
+        ).where(AgentTrade.agent_id == agent_id)
+
+        row = session.execute(stmt).mappings().one()
+
+        total_trades = row["total_trades"] or 0
+        open_trades = row["open_trades"] or 0
+        closed_trades = row["closed_trades"] or 0
+        cancelled_trades = row["cancelled_trades"] or 0
+        total_pnl = row["total_pnl"] or Decimal("0")
+        total_fees = row["total_fees"] or Decimal("0")
 
         return {
             "total_trades": total_trades,
@@ -17,7 +17,7 @@ from ..infrastructure.database import DatabaseManager
 from ..models.database import AgentTrade, TradingAgent
 from ..models.market_data import Position, AccountInfo
 from ..data.hyperliquid_client import HyperliquidClient
-from .hyperliquid_executor import HyperLiquidExecutor
+from .hyperliquid_executor import ExchangeSnapshot, HyperLiquidExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +62,8 @@ class PositionManager:
         self,
         agent_id: UUID,
         executor: Optional[HyperLiquidExecutor] = None,
-        session: Optional[Session] = None
+        session: Optional[Session] = None,
+        snapshot: Optional[ExchangeSnapshot] = None
     ) -> List[Position]:
         """Get current open positions for an agent.
 
@@ -70,18 +71,29 @@ class PositionManager:
             agent_id: Trading agent ID
             executor: Specific executor to use for fetching user state
             session: Optional database session
+            snapshot: Pre-fetched exchange state (skips user state/price calls)
         """
         if session:
-            return self._get_current_positions_internal(agent_id, executor, session)
+            return self._get_current_positions_internal(agent_id, executor, session, snapshot)
         
         with self.db_manager.session_scope() as local_session:
-            return self._get_current_positions_internal(agent_id, executor, local_session)
+            return self._get_current_positions_internal(
+                agent_id, executor, local_session, snapshot
+            )
+
+    def _get_current_price(self, coin: str, snapshot: Optional[ExchangeSnapshot]) -> Decimal:
+        """Get current price, preferring the snapshot's mid price."""
+        if snapshot and coin in snapshot.mid_prices:
+            return Decimal(str(snapshot.mid_prices[coin]))
+        price_obj = self.info_client.get_price(coin)
+        return Decimal(str(price_obj.price))
 
     def _get_current_positions_internal(
         self,
         agent_id: UUID,
         executor: Optional[HyperLiquidExecutor],
-        session: Session
+        session: Session,
+        snapshot: Optional[ExchangeSnapshot] = None
     ) -> List[Position]:
         # Query open trades from database
         open_trades = session.query(AgentTrade).filter_by(
@@ -96,7 +108,10 @@ class PositionManager:
         exchange_positions = {}
         if active_executor and not active_executor.dry_run:
             try:
-                user_state = active_executor.info.user_state(active_executor.wallet_address)
+                if snapshot:
+                    user_state = snapshot.user_state
+                else:
+                    user_state = active_executor.info.user_state(active_executor.wallet_address)
                 for asset_pos in user_state.get("assetPositions", []):
                     pos_data = asset_pos.get("position", {})
                     coin = pos_data.get("coin")
@@ -128,8 +143,7 @@ class PositionManager:
                     continue  # Skip adding to positions list
 
                 # Get current market price
-                price_obj = self.info_client.get_price(trade.coin)
-                current_price = Decimal(str(price_obj.price))
+                current_price = self._get_current_price(trade.coin, snapshot)
 
                 # Determine entry price: prefer exchange data, fallback to DB, then 0
                 if exch_pos and "entryPx" in exch_pos:
@@ -154,7 +168,7 @@ class PositionManager:
                 if exch_pos and "leverage" in exch_pos:
                     leverage = int(exch_pos["leverage"].get("value", 10))
                 else:
-                    agent = session.query(TradingAgent).filter_by(id=agent_id).first()
+                    agent = session.get(TradingAgent, agent_id)
                     leverage = agent.max_leverage if agent else 10
 
                 # Calculate position value
@@ -239,7 +253,8 @@ class PositionManager:
         self,
         agent_id: UUID,
         executor: Optional[HyperLiquidExecutor] = None,
-        session: Optional[Session] = None
+        session: Optional[Session] = None,
+        snapshot: Optional[ExchangeSnapshot] = None
     ) -> AccountInfo:
         """Calculate agent's account value and metrics.
 
@@ -247,20 +262,22 @@ class PositionManager:
             agent_id: Trading agent ID
             executor: Specific executor to use
             session: Optional database session
+            snapshot: Pre-fetched exchange state (skips user state/price calls)
         """
         if session:
-            return self._get_account_value_internal(agent_id, executor, session)
+            return self._get_account_value_internal(agent_id, executor, session, snapshot)
         
         with self.db_manager.session_scope() as local_session:
-            return self._get_account_value_internal(agent_id, executor, local_session)
+            return self._get_account_value_internal(agent_id, executor, local_session, snapshot)
 
     def _get_account_value_internal(
         self,
         agent_id: UUID,
         executor: Optional[HyperLiquidExecutor],
-        session: Session
+        session: Session,
+        snapshot: Optional[ExchangeSnapshot] = None
     ) -> AccountInfo:
-        agent = session.query(TradingAgent).filter_by(id=agent_id).first()
+        agent = session.get(TradingAgent, agent_id)
 
         if not agent:
             raise ValueError(f"Agent not found: {agent_id}")
@@ -273,7 +290,10 @@ class PositionManager:
             
         if active_executor and not active_executor.dry_run:
             try:
-                user_state = active_executor.info.user_state(active_executor.wallet_address)
+                if snapshot:
+                    user_state = snapshot.user_state
+                else:
+                    user_state = active_executor.info.user_state(active_executor.wallet_address)
                 logger.debug(f"Raw user state for {active_executor.wallet_address}: {user_state}")
                 
                 margin_summary = user_state.get("marginSummary", {})
@@ -286,7 +306,9 @@ class PositionManager:
                 margin_used = float(margin_summary.get("totalMarginUsed", 0.0))
                 
                 # Calculate unrealized PnL from positions
-                positions = self.get_current_positions(agent_id, executor=active_executor, session=session)
+                positions = self.get_current_positions(
+                    agent_id, executor=active_executor, session=session, snapshot=snapshot
+                )
                 unrealized_pnl = sum(pos.unrealized_pnl for pos in positions)
                 
                 account_info = AccountInfo(
@@ -308,7 +330,9 @@ class PositionManager:
                 # Fallback to calculated value
 
         # Get all open positions
-        positions = self.get_current_positions(agent_id, executor=executor, session=session)
+        positions = self.get_current_positions(
+            agent_id, executor=executor, session=session, snapshot=snapshot
+        )
 
         # Calculate total position value (notional value)
         position_value = sum(
@@ -360,7 +384,8 @@ class PositionManager:
         agent_id: UUID,
         coin: str,
         target_value_usd: Decimal,
-        leverage: int = 1
+        leverage: int = 1,
+        snapshot: Optional[ExchangeSnapshot] = None
     ) -> Decimal:
         """Calculate position size based on target value and leverage.
 
@@ -369,6 +394,7 @@ class PositionManager:
             coin: Trading pair symbol
             target_value_usd: Target position value in USD
             leverage: Leverage multiplier (default: 1x)
+            snapshot: Pre-fetched exchange state (skips the price call)
 
         Returns:
             Position size in base currency (e.g., BTC quantity)
@@ -381,8 +407,7 @@ class PositionManager:
             >>> print(f"BTC size: {size}")
         """
         # Get current market price
-        price_obj = self.info_client.get_price(coin)
-        current_price = Decimal(str(price_obj.price))
+        current_price = self._get_current_price(coin, snapshot)
 
         # Calculate size in base currency
         # target_value_usd is the notional value desired
@@ -10,7 +10,8 @@ to order execution, including:
 
 import logging
 from decimal import Decimal
-from typing import Optional, Tuple, Dict
+from functools import partial
+from typing import Any, Callable, Dict, Final, FrozenSet, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -43,6 +44,19 @@ class TradingOrchestrator:
         db_manager: DatabaseManager instance
     """
 
+    __slots__ = (
+        "executors",
+        "default_executor",
+        "order_manager",
+        "position_manager",
+        "risk_manager",
+        "db_manager",
+        "_trigger_templates",
+    )
+
+    # Actions that open a new position (built once, not per decision)
+    _OPEN_ACTIONS: Final[FrozenSet[str]] = frozenset({"OPEN_LONG", "OPEN_SHORT"})
+
     def __init__(
         self,
         executors: Dict[str, HyperLiquidExecutor],
@@ -68,6 +82,8 @@ class TradingOrchestrator:
         self.position_manager = position_manager
         self.risk_manager = risk_manager
         self.db_manager = db_manager
+        # Reduce-only trigger order callables keyed by (executor, coin, is_buy, is_tp)
+        self._trigger_templates: Dict[Tuple[HyperLiquidExecutor, str, bool, bool], Callable] = {}
         logger.info(f"TradingOrchestrator initialized with {len(executors)} executors")
 
     def _get_executor(self, agent: TradingAgent) -> HyperLiquidExecutor:
@@ -77,6 +93,27 @@ class TradingOrchestrator:
         
         return self.executors.get(agent.exchange_account, self.default_executor)
 
+    def _get_trigger(
+        self,
+        executor: HyperLiquidExecutor,
+        coin: str,
+        is_buy: bool,
+        is_tp: bool
+    ) -> Callable[..., Tuple[bool, Optional[int], Optional[str]]]:
+        """Get a cached reduce-only trigger order callable for SL/TP placement."""
+        key = (executor, coin, is_buy, is_tp)
+        trigger = self._trigger_templates.get(key)
+        if trigger is None:
+            trigger = partial(
+                executor.place_trigger_order,
+                coin=coin,
+                is_buy=is_buy,
+                is_tp=is_tp,
+                reduce_only=True
+            )
+            self._trigger_templates[key] = trigger
+        return trigger
+
     def execute_decision(
         self,
         agent_id: UUID,
@@ -102,16 +139,16 @@ class TradingOrchestrator:
         decision_id: UUID,
         session: Session
     ) -> Tuple[bool, Optional[str]]:
-        # Load decision from database
-        decision = session.query(AgentDecision).filter_by(id=decision_id).first()
+        # Load decision and agent. Both are only read here, so skip the
+        # autoflush of pending session state.
+        with session.no_autoflush:
+            decision = session.get(AgentDecision, decision_id)
+            agent = session.get(TradingAgent, agent_id)
 
         if not decision:
             logger.error(f"Decision not found: {decision_id}")
             return False, "Decision not found"
 
-        # Load agent from database
-        agent = session.query(TradingAgent).filter_by(id=agent_id).first()
-
         if not agent:
             logger.error(f"Agent not found: {agent_id}")
             return False, "Agent not found"
@@ -120,25 +157,25 @@ class TradingOrchestrator:
         executor = self._get_executor(agent)
         logger.info(f"Using executor for account: {agent.exchange_account or 'default'}")
 
+        action = decision.action
         logger.info(
             f"Executing decision: agent={agent.name}, "
-            f"action={decision.action}, coin={decision.coin}"
+            f"action={action}, coin={decision.coin}"
         )
 
         # Handle different actions
-        if decision.action == "HOLD":
+        if action == "HOLD":
             logger.info("Action is HOLD, no trade executed")
             return True, None
 
-        elif decision.action == "CLOSE_POSITION":
+        if action == "CLOSE_POSITION":
             return self._close_position(agent_id, decision, executor, session)
 
-        elif decision.action in ["OPEN_LONG", "OPEN_SHORT"]:
+        if action in self._OPEN_ACTIONS:
             return self._open_position(agent_id, agent, decision, executor, session)
 
-        else:
-            logger.error(f"Unknown action: {decision.action}")
-            return False, f"Unknown action: {decision.action}"
+        logger.error(f"Unknown action: {action}")
+        return False, f"Unknown action: {action}"
 
     def _open_position(
         self,
@@ -162,6 +199,19 @@ class TradingOrchestrator:
             f"${decision.size_usd} @ {decision.leverage}x"
         )
 
+        # Numeric columns load as Decimal, so compare directly without float()
+        sl_px = decision.stop_loss_price
+        tp_px = decision.take_profit_price
+        has_sl = sl_px is not None and sl_px > 0
+        has_tp = tp_px is not None and tp_px > 0
+
+        # Fetch user state and prices once for risk validation and sizing
+        try:
+            snapshot = executor.snapshot()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Failed to fetch exchange snapshot, steps will fetch their own: {e}")
+            snapshot = None
+
         # Step 1: Validate risk
         is_valid, reason = self.risk_manager.validate_trade(
             agent_id=agent_id,
@@ -169,7 +219,8 @@ class TradingOrchestrator:
             size_usd=decision.size_usd,
             leverage=decision.leverage,
             executor=executor,
-            session=session
+            session=session,
+            snapshot=snapshot
         )
 
         if not is_valid:
@@ -188,12 +239,12 @@ class TradingOrchestrator:
             return False, f"Failed to set leverage: {error}"
 
         # Step 3: Calculate position size in base currency
-        # Note: calculate_position_size uses info_client, doesn't need executor
         size = self.position_manager.calculate_position_size(
             agent_id=agent_id,
             coin=decision.coin,
             target_value_usd=decision.size_usd,
-            leverage=decision.leverage
+            leverage=decision.leverage,
+            snapshot=snapshot
         )
 
         logger.info(f"Calculated position size: {size} {decision.coin}")
@@ -215,25 +266,25 @@ class TradingOrchestrator:
             session=session
         )
 
-        if not success:
+        if not success or trade is None:
             logger.error(f"Trade execution failed: {error}")
             return False, f"Trade execution failed: {error}"
 
         logger.info(f"Position opened successfully: trade_id={trade.id}")
 
         # Step 6: Place stop-loss order if specified
-        if decision.stop_loss_price and float(decision.stop_loss_price) > 0:
+        if has_sl:
             sl_success = self._place_stop_loss(agent_id, trade.id, decision, size, executor)
             if sl_success:
-                logger.info(f"Stop-loss order placed at ${decision.stop_loss_price}")
+                logger.info(f"Stop-loss order placed at ${sl_px}")
             else:
                 logger.warning("Failed to place stop-loss order")
 
         # Step 7: Place take-profit order if specified
-        if decision.take_profit_price and float(decision.take_profit_price) > 0:
+        if has_tp:
             tp_success = self._place_take_profit(agent_id, trade.id, decision, size, executor)
             if tp_success:
-                logger.info(f"Take-profit order placed at ${decision.take_profit_price}")
+                logger.info(f"Take-profit order placed at ${tp_px}")
             else:
                 logger.warning("Failed to place take-profit order")
 
@@ -319,13 +370,10 @@ class TradingOrchestrator:
         # Determine side (opposite of opening trade)
         is_buy = (decision.action == "OPEN_SHORT")
         
-        success, order_id, error = executor.place_trigger_order(
-            coin=decision.coin,
-            is_buy=is_buy,
+        place_stop_loss = self._get_trigger(executor, decision.coin, is_buy, False)
+        success, order_id, error = place_stop_loss(
             size=size,
-            trigger_price=Decimal(str(decision.stop_loss_price)),
-            is_tp=False,
-            reduce_only=True
+            trigger_price=Decimal(str(decision.stop_loss_price))
         )
 
         if success:
@@ -361,13 +409,10 @@ class TradingOrchestrator:
         # Determine side (opposite of opening trade)
         is_buy = (decision.action == "OPEN_SHORT")
 
-        success, order_id, error = executor.place_trigger_order(
-            coin=decision.coin,
-            is_buy=is_buy,
+        place_take_profit = self._get_trigger(executor, decision.coin, is_buy, True)
+        success, order_id, error = place_take_profit(
             size=size,
-            trigger_price=Decimal(str(decision.take_profit_price)),
-            is_tp=True,
-            reduce_only=True
+            trigger_price=Decimal(str(decision.take_profit_price))
         )
 
         if success:
@@ -382,7 +427,7 @@ class TradingOrchestrator:
         self,
         agent_id: UUID,
         session: Optional[Session] = None
-    ) -> dict:
+    ) -> Dict[str, Any]:
         """Get trading execution summary for an agent.
 
         Args:
@@ -398,7 +443,7 @@ class TradingOrchestrator:
         with self.db_manager.session_scope() as local_session:
             return self._get_execution_summary_internal(agent_id, local_session)
 
-    def _get_execution_summary_internal(self, agent_id: UUID, session: Session) -> dict:
+    def _get_execution_summary_internal(self, agent_id: UUID, session: Session) -> Dict[str, Any]:
         # Get trade statistics
         trade_stats = self.order_manager.get_trade_statistics(agent_id, session=session)
 
@@ -1,22 +1,30 @@
 """Pytest configuration and shared fixtures."""
 
 import pytest
-import pandas as pd
 from datetime import datetime, timedelta
-from unittest.mock import Mock
 
-from src.trading_bot.config.models import (
-    TradingConfig,
-    HyperLiquidConfig,
-    LLMConfig,
-    LLMModelConfig,
-)
-from src.trading_bot.models.market_data import Price
 
+def pytest_addoption(parser):
+    """Register command line options."""
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="Run tests marked 'network' that call real external APIs",
+    )
+    parser.addoption(
+        "--use-cached-prices",
+        action="store_true",
+        default=False,
+        help="Reuse market prices saved in the pytest cache by a previous run",
+    )
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_trading_config():
     """Mock trading configuration."""
+    from src.trading_bot.config.models import TradingConfig
+
     return TradingConfig(
         interval_minutes=3,
         coins=["BTC", "ETH", "SOL"],
@@ -28,9 +36,11 @@ def mock_trading_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_exchange_config():
     """Mock exchange configuration."""
+    from src.trading_bot.config.models import HyperLiquidConfig
+
     return HyperLiquidConfig(
         mainnet_url="https://api.hyperliquid.xyz",
         testnet_url="https://api.hyperliquid-testnet.xyz",
@@ -38,9 +48,11 @@ def mock_exchange_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_llm_config():
     """Mock LLM configuration - defines available model pool."""
+    from src.trading_bot.config.models import LLMConfig, LLMModelConfig
+
     return LLMConfig(
         models={
             "deepseek-chat": LLMModelConfig(
@@ -67,51 +79,42 @@ def mock_llm_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_price_data():
     """Mock price data."""
+    from src.trading_bot.models.market_data import Price
+
+    now = datetime.utcnow()
+
     return {
-        "BTC": Price(
-            coin="BTC",
-            price=95420.5,
-            timestamp=datetime.utcnow(),
-            volume_24h=1234567890.0,
-        ),
-        "ETH": Price(
-            coin="ETH",
-            price=3520.75,
-            timestamp=datetime.utcnow(),
-            volume_24h=987654321.0,
-        ),
-        "SOL": Price(
-            coin="SOL",
-            price=142.30,
-            timestamp=datetime.utcnow(),
-            volume_24h=456789012.0,
-        ),
+        coin: Price(coin=coin, price=price, timestamp=now, volume_24h=volume)
+        for coin, price, volume in (
+            ("BTC", 95420.5, 1234567890.0),
+            ("ETH", 3520.75, 987654321.0),
+            ("SOL", 142.30, 456789012.0),
+        )
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_kline_data():
-    """Mock K-line data."""
-    now = datetime.utcnow()
-    data = []
-
-    for i in range(100):
-        timestamp = now - timedelta(minutes=3 * (100 - i))
-        base_price = 95000.0 + (i * 5)  # Uptrend
-
-        data.append({
-            "timestamp": timestamp,
-            "open": base_price,
-            "high": base_price + 50,
-            "low": base_price - 30,
-            "close": base_price + 20,
-            "volume": 1000000.0 + (i * 10000),
-        })
-
-    return pd.DataFrame(data)
+    """Mock K-line data, shared across the session; do not mutate."""
+    import numpy as np
+    import pandas as pd
+
+    i = np.arange(100)
+    base_price = 95000.0 + i * 5  # Uptrend
+
+    return pd.DataFrame({
+        "timestamp": pd.date_range(
+            end=datetime.utcnow() - timedelta(minutes=3), periods=100, freq="3min"
+        ),
+        "open": base_price,
+        "high": base_price + 50,
+        "low": base_price - 30,
+        "close": base_price + 20,
+        "volume": 1000000.0 + i * 10000,
+    })
 
 
 @pytest.fixture
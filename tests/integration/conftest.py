@@ -9,20 +9,37 @@ Provides test fixtures for integration testing using Dry-Run mode:
 
 import pytest
 import os
+import shutil
+from types import MappingProxyType, SimpleNamespace
 from decimal import Decimal
 from typing import Dict, Any
 from datetime import datetime
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
 from unittest.mock import Mock
 
+from trading_bot.data.hyperliquid_client import HyperliquidClient
 from trading_bot.models.database import Base, TradingAgent, AgentTrade
+from trading_bot.models.market_data import Price
+
+
+def _read_only(value):
+    """Recursively wrap dicts in ``MappingProxyType`` and lists in tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _read_only(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_read_only(item) for item in value)
+    return value
 
 
 @pytest.fixture(scope="session")
 def test_config():
-    """Test configuration with dry-run mode enabled."""
-    return {
+    """Test configuration with dry-run mode enabled.
+
+    Built once per session and read-only, so no test can leak changes
+    into the others.
+    """
+    return _read_only({
         "environment": "dry-run",
         "dry_run": {
             "enabled": True,
@@ -55,33 +72,121 @@ def test_config():
             "interval_minutes": 3,
             "coins": ["BTC", "ETH", "SOL"]
         }
-    }
+    })
 
 
-@pytest.fixture(scope="function")
-def test_db_engine():
-    """Create in-memory SQLite database for testing.
+@pytest.fixture(scope="session")
+def hyperliquid_client(test_config):
+    """HyperLiquid client shared by the session so its HTTP pool is reused."""
+    client = HyperliquidClient(
+        base_url=test_config["hyperliquid"]["base_url"], price_cache_ttl=2.0
+    )
+
+    yield client
+
+    client.close()
+
+
+PRICES_CACHE_KEY = "hl/prices"
+
+
+@pytest.fixture(scope="session")
+def cached_prices(request, hyperliquid_client):
+    """First ``get_all_prices()`` result, fetched once per session.
+
+    Every live fetch is saved to the pytest cache; with
+    ``--use-cached-prices`` a saved result is reused instead of calling
+    the API. Tests that compare or time live fetches should call the
+    client directly.
+    """
+    cache = getattr(request.config, "cache", None)
+
+    if cache is not None and request.config.getoption("--use-cached-prices"):
+        saved = cache.get(PRICES_CACHE_KEY, None)
+        if saved is not None:
+            return {
+                coin: Price.model_validate(data) for coin, data in saved.items()
+            }
+
+    prices = hyperliquid_client.get_all_prices()
+
+    if cache is not None:
+        cache.set(
+            PRICES_CACHE_KEY,
+            {coin: price.model_dump(mode="json") for coin, price in prices.items()},
+        )
+
+    return prices
+
+
+@pytest.fixture(scope="session")
+def test_db_template(tmp_path_factory):
+    """Build the schema once into an on-disk SQLite template database."""
+    template_path = tmp_path_factory.mktemp("db_template") / "template.sqlite"
+    engine = create_engine(f"sqlite:///{template_path}", echo=False)
+    with engine.begin() as connection:
+        Base.metadata.create_all(connection, checkfirst=False)
+    engine.dispose()
+
+    return template_path
+
+
+@pytest.fixture(scope="module")
+def test_db_engine(test_db_template, tmp_path_factory):
+    """Create SQLite database for testing.
 
-    Each test gets a fresh database that is automatically cleaned up.
+    Each module gets a copy of the schema template instead of running the
+    DDL again; tests are isolated by ``test_db_session`` rolling back
+    everything they wrote. The file is removed with pytest's tmp dirs;
+    under pytest-xdist each worker gets its own tmp dir, so the template
+    and its copies never collide between workers.
     """
-    engine = create_engine("sqlite:///:memory:", echo=False)
-    Base.metadata.create_all(engine)
+    db_path = tmp_path_factory.mktemp("db") / "test.sqlite"
+    shutil.copyfile(test_db_template, db_path)
+    engine = create_engine(f"sqlite:///{db_path}", echo=False)
+
+    # pysqlite manages transactions itself and breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN so nested transactions work as documented.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
     yield engine
 
-    Base.metadata.drop_all(engine)
     engine.dispose()
 
 
+@pytest.fixture(scope="module")
+def session_factory():
+    """Session factory shared by the module's tests.
+
+    Sessions join the caller's outer transaction through SAVEPOINTs; the
+    connection is bound per test by ``test_db_session``.
+    """
+    return sessionmaker(join_transaction_mode="create_savepoint")
+
+
 @pytest.fixture(scope="function")
-def test_db_session(test_db_engine):
-    """Create database session for testing."""
-    SessionLocal = sessionmaker(bind=test_db_engine)
-    session = SessionLocal()
+def test_db_session(test_db_engine, session_factory):
+    """Create database session for testing.
+
+    The session runs inside an outer transaction and turns its own
+    commits into SAVEPOINT releases, so teardown rolls back all changes
+    made by the test.
+    """
+    connection = test_db_engine.connect()
+    transaction = connection.begin()
+    session = session_factory(bind=connection)
 
     yield session
 
     session.close()
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture(scope="function")
@@ -101,11 +206,17 @@ def sample_agent(test_db_session):
     return agent
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def sample_market_data():
-    """Sample market data for testing."""
-    return {
-        "BTC": {
+    """Sample market data for testing.
+
+    Shared by the whole session, so it is read-only; tests that need to
+    modify it should take a copy with ``dict(sample_market_data)``.
+    """
+    timestamp = datetime.utcnow().isoformat()
+
+    return MappingProxyType({
+        "BTC": MappingProxyType({
             "symbol": "BTC",
             "price": 50000.0,
             "bid": 49995.0,
@@ -114,9 +225,9 @@ def sample_market_data():
             "high_24h": 51000.0,
             "low_24h": 49000.0,
             "change_24h": 2.5,
-            "timestamp": datetime.utcnow().isoformat()
-        },
-        "ETH": {
+            "timestamp": timestamp
+        }),
+        "ETH": MappingProxyType({
             "symbol": "ETH",
             "price": 3000.0,
             "bid": 2998.0,
@@ -125,9 +236,9 @@ def sample_market_data():
             "high_24h": 3100.0,
             "low_24h": 2900.0,
             "change_24h": 1.5,
-            "timestamp": datetime.utcnow().isoformat()
-        },
-        "SOL": {
+            "timestamp": timestamp
+        }),
+        "SOL": MappingProxyType({
             "symbol": "SOL",
             "price": 100.0,
             "bid": 99.8,
@@ -136,15 +247,15 @@ def sample_market_data():
             "high_24h": 105.0,
             "low_24h": 95.0,
             "change_24h": 3.0,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-    }
+            "timestamp": timestamp
+        })
+    })
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def sample_ai_decision():
-    """Sample AI decision for testing."""
-    return {
+    """Sample AI decision for testing (read-only, see ``sample_market_data``)."""
+    return MappingProxyType({
         "action": "buy",
         "symbol": "BTC",
         "confidence": 0.85,
@@ -155,10 +266,10 @@ def sample_ai_decision():
         "take_profit": 52000.0,
         "timeframe": "1h",
         "risk_reward_ratio": 2.0
-    }
+    })
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def mock_hyperliquid_client():
     """Create mock HyperLiquid client for testing."""
     client = Mock()
@@ -199,7 +310,7 @@ def mock_hyperliquid_client():
     return client
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def mock_deepseek_client():
     """Create mock DeepSeek client for testing."""
     client = Mock()
@@ -215,11 +326,11 @@ def mock_deepseek_client():
         "stop_loss": 48000.0
     }
 
-    # Mock chat completion
-    client.chat.completions.create.return_value = Mock(
+    # Mock chat completion (plain data, nothing asserts on the response)
+    client.chat.completions.create.return_value = SimpleNamespace(
         choices=[
-            Mock(
-                message=Mock(
+            SimpleNamespace(
+                message=SimpleNamespace(
                     content='{"action": "buy", "symbol": "BTC", "confidence": 0.85}'
                 )
             )
@@ -251,9 +362,16 @@ def pytest_configure(config):
 
 
 def pytest_collection_modifyitems(config, items):
-    """Modify test collection to add markers."""
+    """Skip real-API tests unless ``--run-network`` is given.
+
+    Integration tests carry the ``integration`` marker in their own
+    modules (``pytestmark`` or class decorators), so no marking by node
+    id is done here.
+    """
+    if config.getoption("--run-network"):
+        return
+
+    skip_network = pytest.mark.skip(reason="use --run-network to call real APIs")
     for item in items:
-        if "integration" in item.nodeid:
-            item.add_marker(pytest.mark.integration)
-        if "slow" in item.keywords:
-            item.add_marker(pytest.mark.slow)
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
@@ -6,37 +6,35 @@ Tests HyperLiquid data collection in dry-run mode:
 - Order book fetching
 """
 
+import os
+import statistics
+import time
+
 import pytest
 from decimal import Decimal
+from unittest.mock import patch
 
-from trading_bot.data.hyperliquid_client import HyperliquidClient
+PERF_SAMPLES = 5
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("hl_api")
 class TestDataCollection:
     """Integration tests for data collection."""
 
-    def test_client_initialization(self, test_config):
+    def test_client_initialization(self, hyperliquid_client, test_config):
         """Test HyperLiquid client initialization."""
-        client = HyperliquidClient(
-            base_url=test_config["hyperliquid"]["base_url"]
-        )
-
-        assert client is not None
-        assert client.base_url == test_config["hyperliquid"]["base_url"]
+        assert hyperliquid_client is not None
+        assert hyperliquid_client.base_url == test_config["hyperliquid"]["base_url"]
 
-    def test_get_all_prices_real_api(self, test_config):
+    @pytest.mark.network
+    def test_get_all_prices_real_api(self, cached_prices):
         """Test fetching real market prices from API.
 
         This test calls the REAL HyperLiquid API to fetch current prices.
         Safe to run in dry-run mode as it's read-only.
         """
-        client = HyperliquidClient(
-            base_url=test_config["hyperliquid"]["base_url"]
-        )
-
-        # Fetch real market data
-        prices = client.get_all_prices()
+        prices = cached_prices
 
         # Verify response structure
         assert prices is not None
@@ -56,8 +54,9 @@ class TestDataCollection:
         if "ETH" in prices:
             print(f"   ETH: ${prices['ETH'].price}")
 
+    @pytest.mark.network
     @pytest.mark.skip(reason="Order book method not yet implemented in HyperliquidClient")
-    def test_get_l2_snapshot_real_api(self, test_config):
+    def test_get_l2_snapshot_real_api(self, hyperliquid_client):
         """Test fetching real order book from API.
 
         This test calls the REAL HyperLiquid API.
@@ -65,12 +64,8 @@ class TestDataCollection:
 
         NOTE: This test is skipped because get_l2_snapshot() is not yet implemented.
         """
-        client = HyperliquidClient(
-            base_url=test_config["hyperliquid"]["base_url"]
-        )
-
         # Fetch real order book for BTC
-        orderbook = client.get_l2_snapshot("BTC")
+        orderbook = hyperliquid_client.get_l2_snapshot("BTC")
 
         # Verify response structure
         assert orderbook is not None
@@ -105,8 +100,9 @@ class TestDataCollection:
         print(f"   Best Ask: ${best_ask_px:.2f}")
         print(f"   Spread: ${spread:.2f} ({spread_pct:.4f}%)")
 
+    @pytest.mark.network
     @pytest.mark.skip(reason="User state method not yet implemented in HyperliquidClient")
-    def test_get_user_state_with_address(self, test_config):
+    def test_get_user_state_with_address(self, hyperliquid_client):
         """Test fetching user state for a valid address.
 
         Note: This will return empty state for test address,
@@ -114,15 +110,11 @@ class TestDataCollection:
 
         NOTE: This test is skipped because get_user_state() is not yet implemented.
         """
-        client = HyperliquidClient(
-            base_url=test_config["hyperliquid"]["base_url"]
-        )
-
         # Use test address
         test_address = "0x0000000000000000000000000000000000000001"
 
         # Fetch user state (will be empty for test address)
-        user_state = client.get_user_state(test_address)
+        user_state = hyperliquid_client.get_user_state(test_address)
 
         # Verify response structure
         assert user_state is not None
@@ -130,16 +122,12 @@ class TestDataCollection:
 
         print(f"\n[OK] User state fetch successful for {test_address}")
 
-    def test_collect_multi_coin_data(self, test_config):
+    @pytest.mark.network
+    def test_collect_multi_coin_data(self, cached_prices, test_config):
         """Test collecting data for multiple coins."""
-        client = HyperliquidClient(
-            base_url=test_config["hyperliquid"]["base_url"]
-        )
-
         coins = test_config["trading"]["coins"]  # ["BTC", "ETH", "SOL"]
 
-        # Get all prices once
-        all_prices = client.get_all_prices()
+        all_prices = cached_prices
 
         # Collect data for all coins
         market_data = {}
@@ -165,43 +153,51 @@ class TestDataCollection:
             price = data.get("price", "N/A")
             print(f"   {coin}: Price=${price}")
 
+    @pytest.mark.network
     @pytest.mark.slow
-    def test_data_collection_performance(self, test_config):
-        """Test data collection performance (should be < 5 seconds)."""
-        import time
-
-        client = HyperliquidClient(
-            base_url=test_config["hyperliquid"]["base_url"]
-        )
-
-        start_time = time.time()
-
-        # Collect data for all trading coins
-        prices = client.get_all_prices()
-
-        # Verify we got data
-        assert len(prices) > 0
-
-        duration = time.time() - start_time
+    @pytest.mark.skipif(not os.getenv("RUN_PERF"), reason="set RUN_PERF=1 to run")
+    def test_data_collection_performance(self, hyperliquid_client, test_config):
+        """Test data collection performance (median should be < 5 seconds)."""
+        coins = test_config["trading"]["coins"]
+
+        timings = []
+        with patch.object(
+            hyperliquid_client, "_post", wraps=hyperliquid_client._post
+        ) as post:
+            for _ in range(PERF_SAMPLES):
+                start = time.perf_counter()
+                # Collect data for all trading coins
+                prices = hyperliquid_client.get_all_prices(force_refresh=True)
+                market_data = {
+                    coin: hyperliquid_client.get_price(coin)
+                    for coin in coins
+                    if coin in prices
+                }
+                timings.append(time.perf_counter() - start)
+
+                # Verify we got data
+                assert len(market_data) > 0
+
+        # One HTTP request per collection, never one per coin
+        assert post.call_count == PERF_SAMPLES
+
+        duration = statistics.median(timings)
 
         # Should complete in < 5 seconds (Phase 4 requirement)
         assert duration < 5.0
 
-        print(f"\n[OK] Data collection completed in {duration:.2f}s (target: <5s)")
+        print(f"\n[OK] Data collection median {duration:.2f}s over {PERF_SAMPLES} runs (target: <5s)")
         print(f"   Fetched {len(prices)} coin prices")
 
-    def test_error_handling_invalid_coin(self, test_config):
+    @pytest.mark.network
+    def test_error_handling_invalid_coin(self, hyperliquid_client):
         """Test error handling for invalid coin symbol."""
-        client = HyperliquidClient(
-            base_url=test_config["hyperliquid"]["base_url"]
-        )
-
         # Try to fetch data for invalid coin
         invalid_coin = "INVALIDCOIN123"
 
         # Should handle gracefully (not crash)
         try:
-            price = client.get_price(invalid_coin)
+            price = hyperliquid_client.get_price(invalid_coin)
             # If it returns something without error, that's unexpected
             print(f"\n[WARN] Got response for invalid coin: {price}")
         except ValueError as e:
@@ -213,15 +209,12 @@ class TestDataCollection:
             print(f"\n[OK] Correctly handled invalid coin with error: {type(e).__name__}")
             assert True
 
-    def test_data_consistency(self, test_config):
+    @pytest.mark.network
+    def test_data_consistency(self, hyperliquid_client):
         """Test that fetched data is consistent across multiple calls."""
-        client = HyperliquidClient(
-            base_url=test_config["hyperliquid"]["base_url"]
-        )
-
         # Fetch data twice
-        prices1 = client.get_all_prices()
-        prices2 = client.get_all_prices()
+        prices1 = hyperliquid_client.get_all_prices(force_refresh=True)
+        prices2 = hyperliquid_client.get_all_prices(force_refresh=True)
 
         # Both should return data
         assert prices1 is not None
@@ -233,10 +226,9 @@ class TestDataCollection:
             price2 = prices2["BTC"].price
 
             # Prices should be similar (within 5% - allows for market movement)
-            price_diff_pct = abs(price1 - price2) / price1 * 100
-            assert price_diff_pct < 5.0
+            assert price2 == pytest.approx(price1, rel=0.05)
 
             print(f"\n[OK] Price consistency check passed:")
             print(f"   Call 1: ${price1:.2f}")
             print(f"   Call 2: ${price2:.2f}")
-            print(f"   Difference: {price_diff_pct:.4f}%")
+            print(f"   Difference: {abs(price1 - price2) / price1 * 100:.4f}%")
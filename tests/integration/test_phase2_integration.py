@@ -6,11 +6,13 @@ import pandas as pd
 from datetime import datetime
 from decimal import Decimal
 from uuid import uuid4
-from unittest.mock import AsyncMock, Mock, MagicMock, patch
+from unittest.mock import Mock, MagicMock
 from contextlib import contextmanager
+from types import MappingProxyType
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from src.trading_bot.models.database import Base, TradingAgent, AgentDecision
 from src.trading_bot.models.market_data import AccountInfo, Position, MarketData, Price
@@ -20,16 +22,73 @@ from src.trading_bot.ai.prompt_builder import PromptBuilder
 from src.trading_bot.ai.decision_parser import DecisionParser
 from src.trading_bot.orchestration.multi_agent_orchestrator import MultiAgentOrchestrator
 
+pytestmark = pytest.mark.integration
+
+DEC_5K = Decimal("5000.00")
+DEC_10K = Decimal("10000.00")
+
+
+def async_return(value):
+    """Stub coroutine function that always returns ``value``."""
+    async def stub(*args, **kwargs):
+        return value
+    return stub
+
+
+def async_raise(exc):
+    """Stub coroutine function that always raises ``exc``."""
+    async def stub(*args, **kwargs):
+        raise exc
+    return stub
+
+
+@pytest.fixture(scope="session")
+def test_engine():
+    """Create the in-memory SQLite database and its schema once."""
+    # StaticPool keeps the single connection that holds the in-memory DB
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite manages transactions itself and breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN so nested transactions work as documented.
+    # The database is discarded after the run, so skip journal writes too.
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    with engine.begin() as connection:
+        Base.metadata.create_all(connection, checkfirst=False)
+
+    yield engine
+
+    engine.dispose()
+
 
 @pytest.fixture(scope="function")
-def test_db():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
+def test_db(test_engine):
+    """Create a session whose changes are rolled back after the test.
+
+    Commits only release SAVEPOINTs inside an outer transaction, so the
+    schema is shared while each test starts from an empty database.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     yield session
     session.close()
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
@@ -46,7 +105,7 @@ def mock_db_manager(test_db):
     return manager
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_llm_config():
     """Create mock LLM configuration."""
     return LLMConfig(
@@ -66,32 +125,67 @@ def mock_llm_config():
 
 @pytest.fixture
 def test_agent(test_db):
-    """Create a test trading agent."""
-    agent = TradingAgent(
+    """Create a test trading agent.
+
+    RETURNING loads the stored row, server defaults included, in the same
+    round trip as the INSERT.
+    """
+    return test_db.scalars(insert(TradingAgent).returning(TradingAgent), [dict(
         id=uuid4(),
         name="Test Agent",
         llm_model="deepseek-test",
         exchange_account="test_account",
-        initial_balance=Decimal("10000.00"),
+        initial_balance=DEC_10K,
         max_position_size=Decimal("20.0"),
         max_leverage=10,
         stop_loss_pct=Decimal("2.0"),
         take_profit_pct=Decimal("5.0"),
         strategy_description="Test strategy",
         status="active"
-    )
-    test_db.add(agent)
-    test_db.commit()
-    test_db.refresh(agent)
-    return agent
+    )]).one()
 
 
 @pytest.fixture
+def make_orchestrator(test_db, mock_db_manager, test_agent, mock_llm_config):
+    """Factory for an orchestrator over ``test_agent`` and optional extra agents.
+
+    ``make_orchestrator("Agent A", "Agent B")`` inserts the extra agents in
+    one statement and returns ``(orchestrator, extra_agent_ids)``.
+    """
+    def make(*extra_agent_names):
+        agent_ids = [uuid4() for _ in extra_agent_names]
+        if extra_agent_names:
+            test_db.execute(insert(TradingAgent), [
+                dict(
+                    id=agent_id,
+                    name=name,
+                    llm_model="deepseek-test",
+                    exchange_account=f"test_account_{name}",
+                    initial_balance=DEC_5K,
+                    status="active"
+                )
+                for agent_id, name in zip(agent_ids, extra_agent_names)
+            ])
+            test_db.flush()
+
+        agent_manager = AgentManager(mock_db_manager, mock_llm_config)
+        return MultiAgentOrchestrator(mock_db_manager, agent_manager), agent_ids
+
+    return make
+
+
+@pytest.fixture(scope="session")
 def mock_market_data():
-    """Create mock market data for 6 coins."""
+    """Create mock market data for 6 coins.
+
+    Shared by the whole session and read-only; take ``dict(...)`` to modify.
+    """
     data = {}
     coins = ["BTC", "ETH", "SOL", "BNB", "DOGE", "XRP"]
-    
+    # One timestamp and one empty frame serve every coin
+    timestamp = datetime.utcnow()
+    empty_klines = pd.DataFrame()
+
     for coin in coins:
         price = 51000.0 if coin == "BTC" else 2950.0 if coin == "ETH" else 150.0
         
@@ -100,10 +194,10 @@ def mock_market_data():
             price=Price(
                 coin=coin,
                 price=price,
-                timestamp=datetime.utcnow()
+                timestamp=timestamp
             ),
-            klines_3m=pd.DataFrame(),
-            klines_4h=pd.DataFrame(),
+            klines_3m=empty_klines,
+            klines_4h=empty_klines,
             indicators_3m={
                 "ema_20": price * 0.99,
                 "macd": 150.5,
@@ -127,10 +221,10 @@ def mock_market_data():
             open_interest=5000000.0,
             funding_rate=0.0001
         )
-    return data
+    return MappingProxyType(data)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_account():
     """Create mock account info."""
     return AccountInfo(
@@ -141,6 +235,89 @@ def mock_account():
     )
 
 
+@pytest.fixture(scope="session")
+def llm_responses():
+    """Canned LLM responses shared by the parser and orchestrator tests."""
+    return MappingProxyType({
+        "open_long": """
+I've analyzed the market conditions and here's my decision:
+
+```json
+{
+    "BTC": {
+        "signal": "long",
+        "confidence": 0.75,
+        "reasoning": "BTC shows strong bullish momentum with RSI at 65 and MACD golden cross on 4h chart",
+        "risk_usd": 333.33,
+        "leverage": 3,
+        "stop_loss": 49000.0,
+        "profit_target": 53000.0
+    }
+}
+```
+
+This is a high-probability setup based on technical indicators.
+""",
+        "open_long_brief": """
+```json
+{
+    "BTC": {
+        "signal": "long",
+        "confidence": 0.75,
+        "reasoning": "BTC showing bullish momentum, opening long position",
+        "risk_usd": 333.33,
+        "leverage": 3,
+        "stop_loss": 49000.0,
+        "profit_target": 53000.0
+    }
+}
+```
+""",
+        "hold": """
+```json
+{
+    "BTC": {
+        "signal": "hold",
+        "confidence": 0.5,
+        "reasoning": "Market conditions are unclear with mixed signals, better to wait for confirmation",
+        "risk_usd": 0.0,
+        "leverage": 1
+    }
+}
+```
+""",
+        "hold_eth": """
+```json
+{
+    "ETH": {
+        "signal": "hold",
+        "confidence": 0.6,
+        "reasoning": "Market too volatile, holding position",
+        "risk_usd": 0.0,
+        "leverage": 1
+    }
+}
+```
+""",
+        "open_short": """
+```json
+{
+    "ETH": {
+        "signal": "short",
+        "confidence": 0.80,
+        "reasoning": "ETH showing bearish divergence on MACD, opening short position with tight stop loss",
+        "risk_usd": 300.0,
+        "leverage": 5,
+        "stop_loss": 3100.0,
+        "profit_target": 2800.0
+    }
+}
+```
+""",
+        "invalid": "This is not JSON at all!",
+    })
+
+
 @pytest.fixture
 def mock_trading_orchestrator(mock_account):
     """Create a mock TradingOrchestrator."""
@@ -184,55 +361,91 @@ class TestAgentManagerIntegration:
         assert agent_manager.get_agent_count() == 1
 
         # Add another agent
-        new_agent = TradingAgent(
+        test_db.execute(insert(TradingAgent), [dict(
             id=uuid4(),
             name="New Agent",
             llm_model="deepseek-test",
             exchange_account="test_account_2",
-            initial_balance=Decimal("5000.00"),
+            initial_balance=DEC_5K,
             status="active"
-        )
-        test_db.add(new_agent)
-        test_db.commit()
+        )])
+        test_db.flush()
 
         # Reload
         agent_manager.reload_agents()
         assert agent_manager.get_agent_count() == 2
 
 
-class TestPromptBuilderIntegration:
-    """Integration tests for PromptBuilder."""
+@pytest.fixture(scope="module")
+def prompt_builder():
+    """PromptBuilder shared by the module's prompt tests."""
+    return PromptBuilder()
 
-    def test_build_full_prompt(self, test_agent, mock_market_data, mock_account):
-        """Test building a complete prompt."""
-        builder = PromptBuilder()
-        positions = []
 
-        prompt = builder.build(
-            market_data=mock_market_data,
-            positions=positions,
-            account=mock_account,
-            agent=test_agent
-        )
+@pytest.fixture(scope="module")
+def prompt_agent():
+    """Unsaved agent for prompt tests; the builder only reads its fields."""
+    return TradingAgent(
+        id=uuid4(),
+        name="Test Agent",
+        llm_model="deepseek-test",
+        exchange_account="test_account",
+        initial_balance=DEC_10K,
+        max_leverage=10,
+        status="active"
+    )
+
+
+def market_data_section(prompt):
+    """Slice the per-coin market data out of a built prompt.
 
-        # Verify prompt structure
-        assert "It has been" in prompt
-        assert "ALL OF THE PRICE OR SIGNAL DATA BELOW IS ORDERED" in prompt
-        assert "HERE IS YOUR ACCOUNT INFORMATION & PERFORMANCE" in prompt
-        assert "TRADING STYLE GUIDELINES" in prompt
+    The header carries the current time, but this section depends only on
+    the market data, so it can be compared verbatim between prompts.
+    """
+    start = prompt.index("\nALL ")
+    end = prompt.index("HERE IS YOUR ACCOUNT INFORMATION & PERFORMANCE")
+    return prompt[start:end]
 
-        # Verify agent-specific data
-        assert "10x" in prompt  # max_leverage
 
-        # Verify market data
-        assert "BTC" in prompt
-        assert "51000.0" in prompt
-        assert "ETH" in prompt
-        assert "2950.0" in prompt
+@pytest.fixture(scope="module")
+def baseline_prompt(prompt_builder, prompt_agent, mock_market_data, mock_account):
+    """Prompt with no open positions, built once for the module."""
+    return prompt_builder.build(
+        market_data=mock_market_data,
+        positions=[],
+        account=mock_account,
+        agent=prompt_agent
+    )
+
+
+class TestPromptBuilderIntegration:
+    """Integration tests for PromptBuilder."""
+
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            # Prompt structure
+            "It has been",
+            "ALL OF THE PRICE OR SIGNAL DATA BELOW IS ORDERED",
+            "HERE IS YOUR ACCOUNT INFORMATION & PERFORMANCE",
+            "TRADING STYLE GUIDELINES",
+            # Agent-specific data (max_leverage)
+            "10x",
+            # Market data
+            "BTC",
+            "51000.0",
+            "ETH",
+            "2950.0",
+        ],
+    )
+    def test_build_full_prompt(self, baseline_prompt, needle):
+        """Test that the complete prompt carries each expected section and value."""
+        assert needle in baseline_prompt
 
-    def test_build_prompt_with_positions(self, test_agent, mock_market_data, mock_account):
+    def test_build_prompt_with_positions(
+        self, prompt_builder, prompt_agent, mock_market_data, mock_account, baseline_prompt
+    ):
         """Test building prompt with existing positions."""
-        builder = PromptBuilder()
         positions = [
             Position(
                 coin="BTC",
@@ -247,175 +460,149 @@ class TestPromptBuilderIntegration:
             )
         ]
 
-        prompt = builder.build(
+        prompt = prompt_builder.build(
             market_data=mock_market_data,
             positions=positions,
             account=mock_account,
-            agent=test_agent
+            agent=prompt_agent
         )
 
-        assert "BTC" in prompt
+        # Positions only change the account section; market data matches
+        # the baseline snapshot exactly
+        assert market_data_section(prompt) == market_data_section(baseline_prompt)
+
         # The prompt builder uses str(dict) which outputs raw numbers
+        assert "'symbol': 'BTC'" in prompt
+        assert "'symbol': 'BTC'" not in baseline_prompt
         assert "50000.0" in prompt
 
 
-class TestDecisionParserIntegration:
-    """Integration tests for DecisionParser."""
-
-    def test_parse_and_validate_complete_flow(self):
-        """Test parsing and validating a complete LLM response."""
-        parser = DecisionParser()
+@pytest.fixture(scope="module")
+def decision_parser():
+    """DecisionParser shared by the module's parser cases."""
+    return DecisionParser()
 
-        llm_response = """
-I've analyzed the market conditions and here's my decision:
 
-```json
-{
-    "BTC": {
-        "signal": "long",
-        "confidence": 0.75,
-        "reasoning": "BTC shows strong bullish momentum with RSI at 65 and MACD golden cross on 4h chart",
-        "risk_usd": 333.33,
-        "leverage": 3,
-        "stop_loss": 49000.0,
-        "profit_target": 53000.0
-    }
-}
-```
+class TestDecisionParserIntegration:
+    """Integration tests for DecisionParser."""
 
-This is a high-probability setup based on technical indicators.
-"""
+    @pytest.mark.parametrize(
+        "response_key, account_value, expected, expected_error",
+        [
+            # size_usd = risk_usd * leverage = 333.33 * 3 = 999.99
+            ("open_long", 10000.0, ("OPEN_LONG", "BTC", 1000.0, 3, 0.75), None),
+            ("hold", 10000.0, ("HOLD", "BTC", 0.0, 1, 0.5), None),
+            # size_usd = 300 * 5 = 1500
+            ("open_short", 10000.0, ("OPEN_SHORT", "ETH", 1500.0, 5, 0.80), None),
+            ("open_long", 500.0, ("OPEN_LONG", "BTC", 1000.0, 3, 0.75), "exceeds account value"),
+            ("invalid", 10000.0, None, None),
+        ],
+        ids=["open_long", "hold", "open_short", "exceeds_account", "invalid_json"],
+    )
+    def test_parse_and_validate(
+        self, decision_parser, llm_responses, response_key, account_value, expected, expected_error
+    ):
+        """Test parsing and validating LLM responses end to end."""
+        decisions = decision_parser.parse(llm_responses[response_key])
 
-        decisions = parser.parse(llm_response)
+        if expected is None:
+            assert decisions == []
+            return
 
+        action, coin, size_usd, leverage, confidence = expected
         assert len(decisions) == 1
         decision = decisions[0]
-        
-        assert decision is not None
-        assert decision.action == "OPEN_LONG"
-        assert decision.coin == "BTC"
-        # size_usd = risk_usd * leverage = 333.33 * 3 = 999.99
-        assert abs(decision.size_usd - 1000.0) < 0.1
-        assert decision.leverage == 3
-        assert decision.confidence == 0.75
 
-        # Test validation
-        is_valid, error_msg = parser.validate_decision_logic(
+        assert decision.action == action
+        assert decision.coin == coin
+        assert abs(decision.size_usd - size_usd) < 0.1
+        assert decision.leverage == leverage
+        assert decision.confidence == confidence
+
+        is_valid, error_msg = decision_parser.validate_decision_logic(
             decision=decision,
             current_positions=[],
-            account_value=10000.0
+            account_value=account_value
         )
 
-        assert is_valid
-        assert error_msg is None
+        if expected_error is None:
+            assert is_valid
+            assert error_msg is None
+        else:
+            assert not is_valid
+            assert expected_error in error_msg
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestMultiAgentOrchestratorIntegration:
     """Integration tests for MultiAgentOrchestrator."""
 
-    async def test_run_decision_cycle(self, test_db, mock_db_manager, test_agent, mock_llm_config, mock_market_data, mock_trading_orchestrator):
-        """Test running a complete decision cycle."""
-        agent_manager = AgentManager(mock_db_manager, mock_llm_config)
-        orchestrator = MultiAgentOrchestrator(mock_db_manager, agent_manager)
+    async def test_run_decision_cycle_scenarios(
+        self, test_db, test_agent, make_orchestrator, mock_market_data, mock_trading_orchestrator, llm_responses
+    ):
+        """Test valid, failing and unparseable LLM responses in one concurrent cycle.
 
-        # Mock LLM response
-        mock_llm_response = """
-```json
-{
-    "BTC": {
-        "signal": "hold",
-        "confidence": 0.5,
-        "reasoning": "Market conditions are unclear with mixed signals, better to wait for confirmation",
-        "risk_usd": 0.0,
-        "leverage": 1
-    }
-}
-```
-"""
+        Each agent gets its own scenario, so the orchestrator's per-agent
+        gather runs all of them at once.
+        """
+        orchestrator, (error_agent_id, invalid_agent_id) = make_orchestrator(
+            "Error Agent", "Invalid Agent"
+        )
 
-        # Patch the LLM provider's generate_async method
-        with patch.object(agent_manager.llm_providers[str(test_agent.id)], 'generate_async',
-                          new_callable=AsyncMock, return_value=mock_llm_response):
+        providers = orchestrator.agent_manager.llm_providers
+        providers[str(test_agent.id)].generate_async = async_return(llm_responses["hold"])
+        providers[str(error_agent_id)].generate_async = async_raise(Exception("API Error"))
+        providers[str(invalid_agent_id)].generate_async = async_return(llm_responses["invalid"])
 
-            decisions = await orchestrator.run_decision_cycle(
-                market_data=mock_market_data,
-                trading_orchestrator=mock_trading_orchestrator
-            )
+        decisions = await orchestrator.run_decision_cycle(
+            market_data=mock_market_data,
+            trading_orchestrator=mock_trading_orchestrator
+        )
+
+        assert len(decisions) == 3
+        by_agent = {d.agent_id: d for d in decisions}
 
-            # Verify decision was created
-            assert len(decisions) == 1
-            decision = decisions[0]
+        # Valid response: HOLD decision saved to the database
+        decision = by_agent[test_agent.id]
+        assert decision.status == "success"
+        assert decision.action == "HOLD"
+        assert decision.coin == "BTC"
+        assert decision.confidence == Decimal("0.50")
 
-            assert decision.agent_id == test_agent.id
-            assert decision.status == "success"
-            assert decision.action == "HOLD"
-            assert decision.coin == "BTC"
-            assert decision.confidence == Decimal("0.50")
+        db_decision = test_db.query(AgentDecision).filter(
+            AgentDecision.id == decision.id
+        ).first()
+        assert db_decision is not None
+        assert db_decision.action == "HOLD"
 
-            # Verify decision was saved to database
-            db_decision = test_db.query(AgentDecision).filter(
-                AgentDecision.id == decision.id
-            ).first()
+        # LLM error: failed decision carrying the error
+        decision = by_agent[error_agent_id]
+        assert decision.status == "failed"
+        assert decision.error_message is not None
+        assert "API Error" in decision.error_message
 
-            assert db_decision is not None
-            assert db_decision.action == "HOLD"
+        # Invalid JSON: failed decision from the parser
+        decision = by_agent[invalid_agent_id]
+        assert decision.status == "failed"
+        assert "Failed to parse JSON decisions" in decision.error_message
 
     async def test_run_decision_cycle_with_multiple_agents(
-        self, test_db, mock_db_manager, test_agent, mock_llm_config, mock_market_data, mock_trading_orchestrator
+        self, test_agent, make_orchestrator, mock_market_data, mock_trading_orchestrator, llm_responses
     ):
         """Test decision cycle with multiple agents running in parallel."""
         # Create second agent
-        agent2 = TradingAgent(
-            id=uuid4(),
-            name="Test Agent 2",
-            llm_model="deepseek-test",
-            exchange_account="test_account_2",
-            initial_balance=Decimal("5000.00"),
-            status="active"
-        )
-        test_db.add(agent2)
-        test_db.commit()
-
-        agent_manager = AgentManager(mock_db_manager, mock_llm_config)
-        orchestrator = MultiAgentOrchestrator(mock_db_manager, agent_manager)
+        orchestrator, (agent2_id,) = make_orchestrator("Test Agent 2")
 
         # Mock different responses for each agent
         mock_responses = {
-            str(test_agent.id): """
-```json
-{
-    "BTC": {
-        "signal": "long",
-        "confidence": 0.75,
-        "reasoning": "BTC showing bullish momentum, opening long position",
-        "risk_usd": 333.33,
-        "leverage": 3,
-        "stop_loss": 49000.0,
-        "profit_target": 53000.0
-    }
-}
-```
-""",
-            str(agent2.id): """
-```json
-{
-    "ETH": {
-        "signal": "hold",
-        "confidence": 0.6,
-        "reasoning": "Market too volatile, holding position",
-        "risk_usd": 0.0,
-        "leverage": 1
-    }
-}
-```
-"""
+            str(test_agent.id): llm_responses["open_long_brief"],
+            str(agent2_id): llm_responses["hold_eth"],
         }
 
         # Patch each provider's generate_async
         for agent_id, response in mock_responses.items():
-            provider = agent_manager.llm_providers[agent_id]
-            provider.generate_async = AsyncMock(return_value=response)
+            provider = orchestrator.agent_manager.llm_providers[agent_id]
+            provider.generate_async = async_return(response)
 
         decisions = await orchestrator.run_decision_cycle(
             market_data=mock_market_data,
@@ -430,116 +617,54 @@ class TestMultiAgentOrchestratorIntegration:
         assert "OPEN_LONG" in actions
         assert "HOLD" in actions
 
-    async def test_run_decision_cycle_handles_llm_errors(
-        self, test_db, mock_db_manager, test_agent, mock_llm_config, mock_market_data, mock_trading_orchestrator
-    ):
-        """Test that orchestrator handles LLM errors gracefully."""
-        agent_manager = AgentManager(mock_db_manager, mock_llm_config)
-        orchestrator = MultiAgentOrchestrator(mock_db_manager, agent_manager)
-
-        # Mock LLM to raise an error
-        with patch.object(agent_manager.llm_providers[str(test_agent.id)], 'generate_async',
-                          side_effect=Exception("API Error")):
-
-            decisions = await orchestrator.run_decision_cycle(
-                market_data=mock_market_data,
-                trading_orchestrator=mock_trading_orchestrator
-            )
-
-            # Verify failed decision was created
-            assert len(decisions) == 1
-            decision = decisions[0]
-
-            assert decision.status == "failed"
-            assert decision.error_message is not None
-            assert "API Error" in decision.error_message
-
-    async def test_run_decision_cycle_handles_invalid_json(
-        self, test_db, mock_db_manager, test_agent, mock_llm_config, mock_market_data, mock_trading_orchestrator
-    ):
-        """Test that orchestrator handles invalid JSON responses."""
-        agent_manager = AgentManager(mock_db_manager, mock_llm_config)
-        orchestrator = MultiAgentOrchestrator(mock_db_manager, agent_manager)
-
-        # Mock LLM to return invalid JSON
-        invalid_response = "This is not JSON at all!"
-
-        with patch.object(agent_manager.llm_providers[str(test_agent.id)], 'generate_async',
-                          new_callable=AsyncMock, return_value=invalid_response):
-
-            decisions = await orchestrator.run_decision_cycle(
-                market_data=mock_market_data,
-                trading_orchestrator=mock_trading_orchestrator
-            )
-
-            # Verify failed decision was created
-            assert len(decisions) == 1
-            decision = decisions[0]
-
-            assert decision.status == "failed"
-            assert "Failed to parse JSON decisions" in decision.error_message
-
 
 class TestEndToEndDecisionCycle:
     """End-to-end integration tests."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_complete_decision_cycle_workflow(
-        self, test_db, mock_db_manager, test_agent, mock_llm_config, mock_market_data, mock_trading_orchestrator
+        self, test_db, test_agent, make_orchestrator, mock_market_data, mock_trading_orchestrator, llm_responses
     ):
         """Test the complete workflow from agent creation to decision storage."""
         # 1. Setup
-        agent_manager = AgentManager(mock_db_manager, mock_llm_config)
-        orchestrator = MultiAgentOrchestrator(mock_db_manager, agent_manager)
+        orchestrator, _ = make_orchestrator()
 
         # 2. Mock LLM response
-        mock_response = """
-```json
-{
-    "ETH": {
-        "signal": "short",
-        "confidence": 0.80,
-        "reasoning": "ETH showing bearish divergence on MACD, opening short position with tight stop loss",
-        "risk_usd": 300.0,
-        "leverage": 5,
-        "stop_loss": 3100.0,
-        "profit_target": 2800.0
-    }
-}
-```
-"""
+        mock_response = llm_responses["open_short"]
 
-        with patch.object(agent_manager.llm_providers[str(test_agent.id)], 'generate_async',
-                          new_callable=AsyncMock, return_value=mock_response):
+        # Providers belong to this test's AgentManager, so assign directly
+        orchestrator.agent_manager.llm_providers[str(test_agent.id)].generate_async = async_return(
+            mock_response
+        )
 
-            # 3. Run decision cycle
-            decisions = await orchestrator.run_decision_cycle(
-                market_data=mock_market_data,
-                trading_orchestrator=mock_trading_orchestrator
-            )
+        # 3. Run decision cycle
+        decisions = await orchestrator.run_decision_cycle(
+            market_data=mock_market_data,
+            trading_orchestrator=mock_trading_orchestrator
+        )
 
-            # 4. Verify decision
-            assert len(decisions) == 1
-            decision = decisions[0]
+        # 4. Verify decision
+        assert len(decisions) == 1
+        decision = decisions[0]
 
-            assert decision.action == "OPEN_SHORT"
-            assert decision.coin == "ETH"
-            # size_usd = 300 * 5 = 1500
-            assert abs(float(decision.size_usd) - 1500.0) < 0.1
-            assert decision.leverage == 5
+        assert decision.action == "OPEN_SHORT"
+        assert decision.coin == "ETH"
+        # size_usd = 300 * 5 = 1500
+        assert abs(float(decision.size_usd) - 1500.0) < 0.1
+        assert decision.leverage == 5
 
-            # 5. Verify database persistence
-            db_decision = test_db.query(AgentDecision).filter(
-                AgentDecision.agent_id == test_agent.id
-            ).first()
+        # 5. Verify database persistence
+        db_decision = test_db.query(AgentDecision).filter(
+            AgentDecision.agent_id == test_agent.id
+        ).first()
 
-            assert db_decision is not None
-            assert db_decision.action == "OPEN_SHORT"
-            assert db_decision.reasoning.startswith("ETH showing bearish")
+        assert db_decision is not None
+        assert db_decision.action == "OPEN_SHORT"
+        assert db_decision.reasoning.startswith("ETH showing bearish")
 
-            # 6. Verify agent performance tracking
-            performance = orchestrator.get_agent_performance(test_agent.id)
+        # 6. Verify agent performance tracking
+        performance = orchestrator.get_agent_performance(test_agent.id)
 
-            assert performance["total_decisions"] == 1
-            assert performance["success_rate"] == 1.0
-            assert float(performance["avg_confidence"]) == 0.80
+        assert performance["total_decisions"] == 1
+        assert performance["success_rate"] == 1.0
+        assert float(performance["avg_confidence"]) == 0.80
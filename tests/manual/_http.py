@@ -0,0 +1,31 @@
+"""Shared HyperLiquid Info clients for the manual scripts.
+
+One ``Info`` per API URL is kept for the life of the process so every call
+goes through the same keep-alive ``requests`` session instead of opening a
+new TCP+TLS connection.
+"""
+
+from typing import Dict
+
+from hyperliquid.info import Info
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_INFO: Dict[str, Info] = {}
+
+
+def get_info(url: str) -> Info:
+    """Return the process-wide ``Info`` client for ``url`` (no websocket)."""
+    info = _INFO.get(url)
+    if info is None:
+        info = Info(url, skip_ws=True)
+        info.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            ),
+        )
+        _INFO[url] = info
+    return info
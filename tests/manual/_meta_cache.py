@@ -0,0 +1,50 @@
+"""Short-lived cache for HyperLiquid Info API reads used by the manual scripts.
+
+Results are kept in-process and in ``~/.cache/hyperdemo`` for a minute, so
+re-running a script while iterating skips the REST round-trips (and the
+metadata fetches ``Info`` does on construction). Cache misses go through
+the shared client from ``_http``.
+"""
+
+import hashlib
+import json
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from _http import get_info
+
+CACHE_DIR = Path.home() / ".cache" / "hyperdemo"
+CACHE_TTL_SECONDS = 60
+
+
+def _cache_file(kind: str, url: str) -> Path:
+    digest = hashlib.sha1(url.encode()).hexdigest()
+    return CACHE_DIR / f"{kind}_{digest}.json"
+
+
+def _cached(kind: str, url: str, fetch):
+    """Return the on-disk result for (kind, url) if fresh, else fetch and store it."""
+    path = _cache_file(kind, url)
+    try:
+        if time.time() - path.stat().st_mtime < CACHE_TTL_SECONDS:
+            return json.loads(path.read_text())
+    except (OSError, ValueError):
+        pass
+
+    data = fetch(get_info(url))
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+    return data
+
+
+@lru_cache(maxsize=None)
+def get_meta(url: str) -> dict:
+    """Perp metadata (``Info.meta()``) for the given API URL."""
+    return _cached("meta", url, lambda info: info.meta())
+
+
+@lru_cache(maxsize=None)
+def get_mids(url: str) -> dict:
+    """Mid prices (``Info.all_mids()``) for the given API URL."""
+    return _cached("mids", url, lambda info: info.all_mids())
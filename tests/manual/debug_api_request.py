@@ -43,12 +43,14 @@ vault_address = None
 
 # Sign the action
 print(f"\nAction to sign:")
-print(json.dumps(action, indent=2))
+json.dump(action, sys.stdout, indent=2)
+print()
 
 signature = signer.sign_l1_action(action, nonce, vault_address)
 
 print(f"\nSignature:")
-print(json.dumps(signature, indent=2))
+json.dump(signature, sys.stdout, indent=2)
+print()
 
 # Construct full payload
 payload = {
@@ -59,7 +61,8 @@ payload = {
 }
 
 print(f"\nFull payload:")
-print(json.dumps(payload, indent=2, default=str))
+json.dump(payload, sys.stdout, indent=2, default=str)
+print()
 
 print("\n" + "=" * 70)
 print("This is what will be sent to HyperLiquid API")
@@ -1,17 +1,14 @@
 #!/usr/bin/env python3
 """Get exact tick size information."""
 
-from hyperliquid.info import Info
+from _meta_cache import get_meta
 
 print("=" * 70)
 print("Get Tick Size Information")
 print("=" * 70)
 
-# Initialize Info API
-info = Info("https://api.hyperliquid-testnet.xyz", skip_ws=True)
-
-# Get metadata
-meta = info.meta()
+# Get metadata (cached for a minute between runs)
+meta = get_meta("https://api.hyperliquid-testnet.xyz")
 
 print("\nFull meta response keys:")
 print(meta.keys())
@@ -6,9 +6,11 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from hyperliquid.info import Info
+import numpy as np
 from hyperliquid.utils import constants
 
+from _meta_cache import get_mids
+
 print("=" * 70)
 print("SDK Rounding Utilities")
 print("=" * 70)
@@ -17,11 +19,8 @@ print("=" * 70)
 print("\nConstants available:")
 print(dir(constants))
 
-# Initialize Info API
-info = Info("https://api.hyperliquid-testnet.xyz", skip_ws=True)
-
-# Get current price
-all_mids = info.all_mids()
+# Get current price (cached for a minute between runs)
+all_mids = get_mids("https://api.hyperliquid-testnet.xyz")
 btc_price = float(all_mids.get("BTC", 0))
 
 print(f"\nBTC Mid Price: ${btc_price:,.2f}")
@@ -32,8 +31,11 @@ print(f"\nBTC Mid Price: ${btc_price:,.2f}")
 
 possible_tick_sizes = [0.1, 0.5, 1, 5, 10, 50, 100]
 
-for tick in possible_tick_sizes:
-    rounded = round(btc_price / tick) * tick
+# Round to every candidate tick in one vectorized step
+ticks = np.asarray(possible_tick_sizes, dtype=float)
+rounded_prices = np.round(btc_price / ticks) * ticks
+
+for tick, rounded in zip(possible_tick_sizes, rounded_prices.tolist()):
     print(f"Tick {tick:>6}: ${rounded:>12,.2f}")
 
 print("\n" + "=" * 70)
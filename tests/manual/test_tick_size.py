@@ -8,7 +8,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from dotenv import load_dotenv
-from hyperliquid.info import Info
+
+from _meta_cache import get_meta, get_mids
 
 load_dotenv()
 
@@ -16,11 +17,10 @@ print("=" * 70)
 print("HyperLiquid Asset Metadata Check")
 print("=" * 70)
 
-# Initialize Info API
-info = Info("https://api.hyperliquid-testnet.xyz", skip_ws=True)
+API_URL = "https://api.hyperliquid-testnet.xyz"
 
-# Get metadata
-meta = info.meta()
+# Get metadata (cached for a minute between runs)
+meta = get_meta(API_URL)
 universe = meta.get("universe", [])
 
 # Find BTC
@@ -36,7 +36,7 @@ if btc_meta:
     print(f"  Size Decimals: {btc_meta.get('szDecimals')}")
 
     # Get current price
-    all_mids = info.all_mids()
+    all_mids = get_mids(API_URL)
     btc_price = float(all_mids.get("BTC", 0))
     print(f"\n  Current Mid Price: ${btc_price:,.2f}")
 
@@ -12,14 +12,13 @@ This test checks:
 import os
 import sys
 from pathlib import Path
-from datetime import datetime, UTC
 from decimal import Decimal
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from dotenv import load_dotenv
-from sqlalchemy import text
+from sqlalchemy import func, select, text
 
 from trading_bot.infrastructure.database import DatabaseManager
 from trading_bot.models.database import (
@@ -32,10 +31,15 @@ from trading_bot.models.database import (
 
 
 def print_section(title):
-    """Print a section header."""
+    """Print a section header.
+
+    Also flushes stdout, so when it is piped (and block-buffered) the
+    report is written once per step while progress stays visible.
+    """
     print("\n" + "=" * 70)
     print(f"  {title}")
     print("=" * 70)
+    sys.stdout.flush()
 
 
 def main():
@@ -61,8 +65,9 @@ def main():
 
         print(f"\n  Connecting to: postgresql://{db_user}:***@{db_host}:{db_port}/{db_name}")
 
-        # Initialize DatabaseManager
-        db_manager = DatabaseManager(db_url)
+        # Initialize DatabaseManager; this one-shot script never needs more
+        # than one connection at a time
+        db_manager = DatabaseManager(db_url, pool_size=1, max_overflow=0)
         engine = db_manager.engine
 
         # Test connection
@@ -94,14 +99,15 @@ def main():
     print_section("Step 2: Create Database Tables")
 
     try:
-        # Drop all tables first (for clean test)
-        print("\n  Dropping existing tables...")
-        Base.metadata.drop_all(engine)
-        print("  [OK] Dropped all tables")
-
-        # Create all tables
-        print("\n  Creating tables...")
-        Base.metadata.create_all(engine)
+        # Drop and recreate in one DDL transaction (for clean test); the
+        # tables are known to be gone, so skip the per-table existence checks
+        with engine.begin() as conn:
+            print("\n  Dropping existing tables...")
+            Base.metadata.drop_all(conn)
+            print("  [OK] Dropped all tables")
+
+            print("\n  Creating tables...")
+            Base.metadata.create_all(conn, checkfirst=False)
         print("  [OK] Created all tables")
 
         # List tables
@@ -143,11 +149,12 @@ def main():
             take_profit_pct=Decimal("5.00")
         )
         session.add(agent)
-        session.commit()
+        session.flush()  # Assigns agent.id without committing
         print(f"  [OK] Created agent: {agent.name} (ID: {agent.id})")
 
-        # Create a decision
-        print("\n  Creating AgentDecision...")
+        # Create the decision, trade and performance snapshot, then insert
+        # them with a single flush
+        print("\n  Creating AgentDecision, AgentTrade and AgentPerformance...")
         decision = AgentDecision(
             agent_id=agent.id,
             coin="BTC",
@@ -160,15 +167,12 @@ def main():
             take_profit_price=Decimal("52000.00"),
             status="success"
         )
-        session.add(decision)
-        session.commit()
-        print(f"  [OK] Created decision: {decision.action} {decision.coin} (ID: {decision.id})")
 
-        # Create a trade (replaces Order/Position concepts in this schema)
-        print("\n  Creating AgentTrade...")
+        # Trade replaces Order/Position concepts in this schema; linking
+        # through the relationship fills decision_id at flush time
         trade = AgentTrade(
             agent_id=agent.id,
-            decision_id=decision.id,
+            decision=decision,
             coin="BTC",
             side="long",
             size=Decimal("0.002"),
@@ -176,12 +180,7 @@ def main():
             status="open",
             unrealized_pnl=Decimal("20.00")
         )
-        session.add(trade)
-        session.commit()
-        print(f"  [OK] Created trade: {trade.side} {trade.size} {trade.coin} (ID: {trade.id})")
 
-        # Create performance snapshot
-        print("\n  Creating AgentPerformance...")
         perf = AgentPerformance(
             agent_id=agent.id,
             total_value=Decimal("1020.00"),
@@ -195,10 +194,15 @@ def main():
             num_winning_trades=0,
             num_losing_trades=0
         )
-        session.add(perf)
-        session.commit()
+        session.add_all([decision, trade, perf])
+        session.flush()
+        print(f"  [OK] Created decision: {decision.action} {decision.coin} (ID: {decision.id})")
+        print(f"  [OK] Created trade: {trade.side} {trade.size} {trade.coin} (ID: {trade.id})")
         print(f"  [OK] Created performance snapshot for agent {agent.name} (ID: {perf.id})")
 
+        # One commit for everything created above
+        session.commit()
+
     except Exception as e:
         print(f"\n[ERROR] CRUD operations failed: {e}")
         session.rollback()
@@ -237,19 +241,30 @@ def main():
     print_section("Step 5: Test Queries")
 
     try:
-        # Query active agents
-        active_agents = session.query(TradingAgent).filter_by(status="active").all()
-        print(f"\n  Active agents: {len(active_agents)}")
-
-        # Query recent decisions
-        recent_decisions = session.query(AgentDecision).order_by(
-            AgentDecision.timestamp.desc()
-        ).limit(10).all()
-        print(f"  Recent decisions: {len(recent_decisions)}")
-
-        # Query open trades
-        open_trades = session.query(AgentTrade).filter_by(status="open").all()
-        print(f"  Open trades: {len(open_trades)}")
+        # The step only reports counts, so fetch all three in one statement
+        recent = (
+            select(AgentDecision.id)
+            .order_by(AgentDecision.timestamp.desc())
+            .limit(10)
+            .subquery()
+        )
+        active_agents, recent_decisions, open_trades = session.execute(
+            select(
+                select(func.count())
+                .select_from(TradingAgent)
+                .where(TradingAgent.status == "active")
+                .scalar_subquery(),
+                select(func.count()).select_from(recent).scalar_subquery(),
+                select(func.count())
+                .select_from(AgentTrade)
+                .where(AgentTrade.status == "open")
+                .scalar_subquery(),
+            )
+        ).one()
+
+        print(f"\n  Active agents: {active_agents}")
+        print(f"  Recent decisions: {recent_decisions}")
+        print(f"  Open trades: {open_trades}")
 
         print("\n  [OK] All queries working")
 
@@ -267,13 +282,15 @@ def main():
         trade.status = "closed"
         trade.exit_price = Decimal("52000.00")
         trade.realized_pnl = Decimal("40.00")
-        trade.exit_time = datetime.now(UTC)
-        session.commit()
-        print(f"\n  [OK] Closed trade with PnL ${trade.realized_pnl}")
+        # Stamped by PostgreSQL (NOW()) in the UPDATE itself
+        trade.exit_time = func.now()
 
         # Update agent balance
         agent.initial_balance += trade.realized_pnl
+
+        # Both updates go out in one commit
         session.commit()
+        print(f"\n  [OK] Closed trade with PnL ${trade.realized_pnl}")
         print(f"  [OK] Updated agent balance to ${agent.initial_balance}")
 
     except Exception as e:
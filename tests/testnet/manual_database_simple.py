@@ -2,6 +2,7 @@
 """Simple database connectivity and basic operations test."""
 
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -41,8 +42,9 @@ def main():
     print(f"\n  Connecting to: postgresql://{db_user}:***@{db_host}:{db_port}/{db_name}")
 
     try:
-        # Initialize DatabaseManager
-        db_manager = DatabaseManager(db_url)
+        # Initialize DatabaseManager; this one-shot script never needs more
+        # than one connection at a time
+        db_manager = DatabaseManager(db_url, pool_size=1, max_overflow=0)
         engine = db_manager.engine
 
         # Test connection
@@ -74,14 +76,18 @@ def main():
                 tables = [row[0] for row in result]
                 print(f"       Tables: {', '.join(tables)}")
 
-                # Get row counts
-                for table in tables:
+                # Get row counts for all tables in one round-trip. Names come
+                # from pg_tables, but are still checked before being inlined.
+                names = [t for t in tables if re.fullmatch(r"[a-z_][a-z0-9_]*", t)]
+                if names:
+                    count_sql = " UNION ALL ".join(
+                        f"SELECT '{t}' AS tbl, COUNT(*) AS n FROM {t}" for t in names
+                    )
                     try:
-                        result = conn.execute(text(f"SELECT COUNT(*) FROM {table}"))
-                        count = result.scalar()
-                        print(f"       - {table}: {count} rows")
-                    except:
-                        pass
+                        for table, count in conn.execute(text(count_sql)):
+                            print(f"       - {table}: {count} rows")
+                    except Exception as e:
+                        print(f"       [WARNING] Could not count rows: {e}")
 
             else:
                 print(f"\n  [INFO] No tables found - run migrations first:")
@@ -63,6 +63,50 @@ class TestHyperliquidClient:
         assert prices["BTC"].price == 95420.5
         assert prices["BTC"].volume_24h == 1234567890
 
+    def test_get_all_prices_cached_within_ttl(self, mocker):
+        """Test repeated get_all_prices calls reuse the cached result."""
+        client = HyperliquidClient("https://test.api", price_cache_ttl=60)
+
+        mock_post = mocker.patch.object(
+            client, "_post", return_value={"BTC": "95420.5"}
+        )
+
+        first = client.get_all_prices()
+        second = client.get_all_prices()
+
+        assert mock_post.call_count == 1
+        assert second == first
+        assert second is not first  # Callers get their own dict
+
+    def test_get_all_prices_force_refresh(self, mocker):
+        """Test force_refresh bypasses the price cache."""
+        client = HyperliquidClient("https://test.api", price_cache_ttl=60)
+
+        mock_post = mocker.patch.object(
+            client,
+            "_post",
+            side_effect=[{"BTC": "95420.5"}, {"BTC": "95500.0"}],
+        )
+
+        client.get_all_prices()
+        prices = client.get_all_prices(force_refresh=True)
+
+        assert mock_post.call_count == 2
+        assert prices["BTC"].price == 95500.0
+
+    def test_get_all_prices_cache_disabled_by_default(self, mocker):
+        """Test the price cache is off unless price_cache_ttl is set."""
+        client = HyperliquidClient("https://test.api")
+
+        mock_post = mocker.patch.object(
+            client, "_post", return_value={"BTC": "95420.5"}
+        )
+
+        client.get_all_prices()
+        client.get_all_prices()
+
+        assert mock_post.call_count == 2
+
     def test_get_price_specific_coin(self, mocker):
         """Test get_price for specific coin."""
         client = HyperliquidClient("https://test.api")
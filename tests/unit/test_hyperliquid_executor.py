@@ -292,6 +292,28 @@ class TestHyperLiquidExecutor:
         assert executor_dry_run.wallet_address in repr_str
         assert "DRY-RUN" in repr_str
 
+    def test_snapshot_live(self, executor_live):
+        """Test snapshot fetches user state and mid prices once."""
+        executor_live.info.user_state.return_value = {"marginSummary": {"accountValue": "100"}}
+        executor_live.info.all_mids.return_value = {"BTC": "50000.5", "ETH": "3000"}
+
+        snapshot = executor_live.snapshot()
+
+        executor_live.info.user_state.assert_called_once_with(executor_live.wallet_address)
+        executor_live.info.all_mids.assert_called_once()
+        assert snapshot.user_state == {"marginSummary": {"accountValue": "100"}}
+        assert snapshot.mid_prices == {"BTC": 50000.5, "ETH": 3000.0}
+
+    def test_snapshot_dry_run_skips_user_state(self, executor_dry_run):
+        """Test dry-run snapshot only fetches mid prices."""
+        executor_dry_run.info.all_mids.return_value = {"BTC": "50000"}
+
+        snapshot = executor_dry_run.snapshot()
+
+        executor_dry_run.info.user_state.assert_not_called()
+        assert snapshot.user_state == {}
+        assert snapshot.mid_prices == {"BTC": 50000.0}
+
     def test_repr_live_mode(self, executor_live):
         """Test string representation for live mode."""
         repr_str = repr(executor_live)
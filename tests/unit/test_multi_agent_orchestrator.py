@@ -0,0 +1,67 @@
+"""Unit tests for MultiAgentOrchestrator."""
+
+import pytest
+from unittest.mock import Mock
+from uuid import uuid4
+
+from src.trading_bot.ai.decision_parser import TradingDecision
+from src.trading_bot.infrastructure.database import DatabaseManager
+from src.trading_bot.models.database import AgentDecision, Base
+from src.trading_bot.orchestration.multi_agent_orchestrator import MultiAgentOrchestrator
+
+
+class TestSaveDecisions:
+    """Test MultiAgentOrchestrator._save_decisions against in-memory SQLite."""
+
+    @pytest.fixture
+    def db_manager(self):
+        """Create database manager with the full schema."""
+        manager = DatabaseManager(db_url="sqlite:///:memory:")
+        Base.metadata.create_all(manager.engine)
+
+        yield manager
+
+        manager.dispose()
+
+    @pytest.fixture
+    def orchestrator(self, db_manager):
+        """Create orchestrator backed by the in-memory database."""
+        return MultiAgentOrchestrator(db_manager, Mock())
+
+    def test_save_decisions_keeps_order(self, orchestrator, db_manager):
+        """Test saved decisions come back in input order with ids."""
+        agent = Mock(id=uuid4())
+        agent.name = "Test Agent"
+
+        success = orchestrator._create_successful_decision(
+            agent,
+            TradingDecision(
+                reasoning="Strong uptrend on BTC",
+                action="OPEN_LONG",
+                coin="ETH",
+                size_usd=500.0,
+                leverage=2,
+                stop_loss_price=3000.0,
+                take_profit_price=3600.0,
+                confidence=0.8,
+            ),
+            llm_response="{}",
+            prompt_content="prompt",
+            duration_ms=120,
+        )
+        failed = orchestrator._create_failed_decision(agent, "LLM timeout")
+
+        saved = orchestrator._save_decisions([success, failed])
+
+        assert [d.status for d in saved] == ["success", "failed"]
+        assert [d.coin for d in saved] == ["ETH", "BTC"]
+        assert all(d.id is not None for d in saved)
+        assert saved[0].id != saved[1].id
+        assert saved[1].error_message == "LLM timeout"
+
+        with db_manager.session_scope() as session:
+            assert session.query(AgentDecision).count() == 2
+
+    def test_save_decisions_empty(self, orchestrator):
+        """Test an empty cycle saves nothing."""
+        assert orchestrator._save_decisions([]) == []
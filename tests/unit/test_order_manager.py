@@ -170,7 +170,7 @@ class TestOrderManager:
         mock_trade.coin = "BTC"
         mock_trade.hyperliquid_order_id = "12345"
 
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_trade
+        mock_session.get.return_value = mock_trade
         mock_executor.cancel_order.return_value = (True, None)
 
         success, error = order_manager.cancel_trade(trade_id)
@@ -187,7 +187,7 @@ class TestOrderManager:
 
     def test_cancel_trade_not_found(self, order_manager, mock_session):
         """Test cancelling non-existent trade."""
-        mock_session.query.return_value.filter_by.return_value.first.return_value = None
+        mock_session.get.return_value = None
 
         success, error = order_manager.cancel_trade(uuid4())
 
@@ -199,7 +199,7 @@ class TestOrderManager:
         mock_trade = Mock(spec=AgentTrade)
         mock_trade.status = "closed"
 
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_trade
+        mock_session.get.return_value = mock_trade
 
         success, error = order_manager.cancel_trade(uuid4())
 
@@ -213,7 +213,7 @@ class TestOrderManager:
         mock_trade.coin = "BTC"
         mock_trade.hyperliquid_order_id = "12345"
 
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_trade
+        mock_session.get.return_value = mock_trade
         mock_executor.cancel_order.return_value = (False, "Order not found")
 
         success, error = order_manager.cancel_trade(uuid4())
@@ -229,7 +229,7 @@ class TestOrderManager:
         mock_trade.id = trade_id
         mock_trade.status = "open"
 
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_trade
+        mock_session.get.return_value = mock_trade
 
         success, error = order_manager.close_trade(
             trade_id=trade_id,
@@ -250,7 +250,7 @@ class TestOrderManager:
 
     def test_close_trade_not_found(self, order_manager, mock_session):
         """Test closing non-existent trade."""
-        mock_session.query.return_value.filter_by.return_value.first.return_value = None
+        mock_session.get.return_value = None
 
         success, error = order_manager.close_trade(uuid4())
 
@@ -262,7 +262,7 @@ class TestOrderManager:
         mock_trade = Mock(spec=AgentTrade)
         mock_trade.status = "closed"
 
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_trade
+        mock_session.get.return_value = mock_trade
 
         success, error = order_manager.close_trade(uuid4())
 
@@ -274,12 +274,12 @@ class TestOrderManager:
         trade_id = uuid4()
         mock_trade = Mock(spec=AgentTrade)
 
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_trade
+        mock_session.get.return_value = mock_trade
 
         trade = order_manager.get_trade(trade_id)
 
         assert trade == mock_trade
-        mock_session.query.assert_called()
+        mock_session.get.assert_called_once_with(AgentTrade, trade_id)
 
     def test_get_agent_trades(self, order_manager, mock_session):
         """Test getting trades for an agent."""
@@ -354,7 +354,7 @@ class TestOrderManager:
             Mock(spec=AgentTrade, status="open", coin="SOL", hyperliquid_order_id="3")
         ]
 
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = mock_trades
+        mock_session.get.side_effect = mock_trades
         mock_executor.cancel_order.return_value = (True, None)
 
         results = order_manager.batch_cancel_trades(trade_ids)
@@ -369,15 +369,15 @@ class TestOrderManager:
         """Test getting trade statistics."""
         agent_id = uuid4()
 
-        # Mock trades
-        mock_trades = [
-            Mock(spec=AgentTrade, status="open", realized_pnl=None, fees=None),
-            Mock(spec=AgentTrade, status="closed", realized_pnl=Decimal("100"), fees=Decimal("5")),
-            Mock(spec=AgentTrade, status="closed", realized_pnl=Decimal("-50"), fees=Decimal("3")),
-            Mock(spec=AgentTrade, status="cancelled", realized_pnl=None, fees=None),
-        ]
-
-        mock_session.query.return_value.filter_by.return_value.all.return_value = mock_trades
+        # Mock aggregate row
+        mock_session.execute.return_value.mappings.return_value.one.return_value = {
+            "total_trades": 4,
+            "open_trades": 1,
+            "closed_trades": 2,
+            "cancelled_trades": 1,
+            "total_pnl": Decimal("50"),
+            "total_fees": Decimal("8"),
+        }
 
         stats = order_manager.get_trade_statistics(agent_id)
 
@@ -387,6 +387,7 @@ class TestOrderManager:
         assert stats["cancelled_trades"] == 1
         assert stats["total_pnl"] == Decimal("50")  # 100 - 50
         assert stats["total_fees"] == Decimal("8")  # 5 + 3
+        mock_session.query.assert_not_called()
 
     def test_repr(self, order_manager):
         """Test string representation."""
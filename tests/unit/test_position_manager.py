@@ -90,7 +90,7 @@ class TestPositionManager:
 
         # Mock database queries
         mock_session.query.return_value.filter_by.return_value.all.return_value = [mock_open_trades[0]]
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
 
         # Mock price (current > entry, so profit)
         price_obj = Mock()
@@ -118,7 +118,7 @@ class TestPositionManager:
 
         # Mock database queries
         mock_session.query.return_value.filter_by.return_value.all.return_value = [mock_open_trades[1]]
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
 
         # Mock price (current < entry, so profit for short)
         price_obj = Mock()
@@ -144,7 +144,7 @@ class TestPositionManager:
 
         # Mock database queries
         mock_session.query.return_value.filter_by.return_value.all.return_value = mock_open_trades
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
 
         # Mock prices
         def get_price_side_effect(coin):
@@ -168,7 +168,7 @@ class TestPositionManager:
         agent_id = mock_agent.id
 
         mock_session.query.return_value.filter_by.return_value.all.return_value = [mock_open_trades[0]]
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
 
         # Mock price error
         mock_client.get_price.side_effect = Exception("Price API error")
@@ -183,7 +183,7 @@ class TestPositionManager:
         agent_id = mock_agent.id
 
         mock_session.query.return_value.filter_by.return_value.all.return_value = mock_open_trades
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
 
         def get_price_side_effect(coin):
             price_obj = Mock()
@@ -210,7 +210,7 @@ class TestPositionManager:
         agent_id = mock_agent.id
 
         mock_session.query.return_value.filter_by.return_value.all.return_value = [mock_open_trades[0]]
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
         
         price_obj = Mock()
         price_obj.price = Decimal("50000")
@@ -230,7 +230,7 @@ class TestPositionManager:
 
         # Mock open positions
         mock_session.query.return_value.filter_by.return_value.all.return_value = mock_open_trades
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
 
         # Mock prices
         def get_price_side_effect(coin):
@@ -266,7 +266,7 @@ class TestPositionManager:
 
     def test_get_account_value_agent_not_found(self, position_manager, mock_session):
         """Test account value when agent doesn't exist."""
-        mock_session.query.return_value.filter_by.return_value.first.return_value = None
+        mock_session.get.return_value = None
 
         with pytest.raises(ValueError, match="Agent not found"):
             position_manager.get_account_value(uuid4())
@@ -279,7 +279,7 @@ class TestPositionManager:
 
         # No open positions
         mock_session.query.return_value.filter_by.return_value.all.return_value = []
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
 
         # No realized PnL
         mock_session.query.return_value.filter_by.return_value.scalar.return_value = None
@@ -329,7 +329,7 @@ class TestPositionManager:
 
         # Mock database queries
         mock_session.query.return_value.filter_by.return_value.all.return_value = mock_open_trades
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
 
         # Mock prices
         def get_price_side_effect(coin):
@@ -359,7 +359,7 @@ class TestPositionManager:
 
         # Mock database queries
         mock_session.query.return_value.filter_by.return_value.all.return_value = mock_open_trades
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
 
         # Mock prices
         def get_price_side_effect(coin):
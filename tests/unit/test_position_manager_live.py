@@ -6,7 +6,7 @@ from uuid import uuid4
 from src.trading_bot.trading.position_manager import PositionManager
 from src.trading_bot.models.database import TradingAgent, AgentTrade
 from src.trading_bot.data.hyperliquid_client import HyperliquidClient
-from src.trading_bot.trading.hyperliquid_executor import HyperLiquidExecutor
+from src.trading_bot.trading.hyperliquid_executor import ExchangeSnapshot, HyperLiquidExecutor
 
 class TestPositionManagerLive:
     @pytest.fixture
@@ -55,7 +55,7 @@ class TestPositionManagerLive:
         trade.agent_id = agent_id
         
         mock_db_session.query.return_value.filter_by.return_value.all.return_value = [trade]
-        mock_db_session.query.return_value.filter_by.return_value.first.return_value = MagicMock(max_leverage=10)
+        mock_db_session.get.return_value = MagicMock(max_leverage=10)
 
         # Setup Exchange State
         mock_executor.info.user_state.return_value = {
@@ -118,7 +118,7 @@ class TestPositionManagerLive:
         agent = MagicMock(spec=TradingAgent)
         agent.id = agent_id
         agent.name = "Test Agent"
-        mock_db_session.query.return_value.filter_by.return_value.first.return_value = agent
+        mock_db_session.get.return_value = agent
 
         # Setup Exchange State
         mock_executor.info.user_state.return_value = {
@@ -143,7 +143,7 @@ class TestPositionManagerLive:
         agent.id = agent_id
         agent.initial_balance = Decimal("1000.0")
         agent.max_leverage = 10
-        mock_db_session.query.return_value.filter_by.return_value.first.return_value = agent
+        mock_db_session.get.return_value = agent
         
         # Mock realized PnL query
         mock_db_session.query.return_value.filter_by.return_value.scalar.return_value = Decimal("100.0")
@@ -159,3 +159,49 @@ class TestPositionManagerLive:
         # 1000 + 100 = 1100
         assert account_info.account_value == 1100.0
 
+
+    def test_get_account_value_with_snapshot(self, mock_db_manager, mock_db_session, mock_info_client, mock_executor, agent_id):
+        agent = MagicMock(spec=TradingAgent)
+        agent.id = agent_id
+        agent.name = "Test Agent"
+        agent.max_leverage = 10
+        mock_db_session.get.return_value = agent
+
+        trade = MagicMock(spec=AgentTrade)
+        trade.id = 1
+        trade.coin = "BTC"
+        trade.size = Decimal("0.1")
+        trade.entry_price = Decimal("40000.0")
+        trade.side = "long"
+        trade.status = "open"
+        mock_db_session.query.return_value.filter_by.return_value.all.return_value = [trade]
+
+        snapshot = ExchangeSnapshot(
+            user_state={
+                "marginSummary": {"accountValue": "10000.0", "totalMarginUsed": "2000.0"},
+                "withdrawable": "5000.0",
+                "assetPositions": [
+                    {"position": {"coin": "BTC", "szi": "0.1", "entryPx": "40000.0"}}
+                ]
+            },
+            mid_prices={"BTC": 41000.0}
+        )
+
+        manager = PositionManager(mock_info_client, mock_db_manager, mock_executor)
+        account_info = manager.get_account_value(agent_id, snapshot=snapshot)
+
+        # Everything comes from the snapshot: no user state or price calls
+        mock_executor.info.user_state.assert_not_called()
+        mock_info_client.get_price.assert_not_called()
+        assert account_info.account_value == 10000.0
+        assert account_info.withdrawable == 5000.0
+        assert account_info.unrealized_pnl == pytest.approx(100.0)  # 0.1 * (41000 - 40000)
+
+    def test_calculate_position_size_with_snapshot(self, mock_db_manager, mock_info_client, agent_id):
+        snapshot = ExchangeSnapshot(mid_prices={"BTC": 50000.0})
+
+        manager = PositionManager(mock_info_client, mock_db_manager)
+        size = manager.calculate_position_size(agent_id, "BTC", Decimal("10000"), snapshot=snapshot)
+
+        assert size == Decimal("0.2")
+        mock_info_client.get_price.assert_not_called()
@@ -70,7 +70,7 @@ class TestRiskManager:
         agent_id = mock_agent.id
 
         # Mock database and position manager
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
         mock_position_manager.get_account_value.return_value = mock_account_info
         mock_position_manager.get_total_exposure.return_value = 0.0
 
@@ -87,7 +87,7 @@ class TestRiskManager:
 
     def test_validate_trade_agent_not_found(self, risk_manager, mock_session):
         """Test validation when agent doesn't exist."""
-        mock_session.query.return_value.filter_by.return_value.first.return_value = None
+        mock_session.get.return_value = None
 
         valid, reason = risk_manager.validate_trade(
             agent_id=uuid4(),
@@ -105,7 +105,7 @@ class TestRiskManager:
         """Test validation when leverage exceeds maximum."""
         agent_id = mock_agent.id
 
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
         mock_position_manager.get_account_value.return_value = mock_account_info
 
         # Try to use 20x leverage when max is 10x
@@ -127,7 +127,7 @@ class TestRiskManager:
         """Test validation when position size exceeds limit."""
         agent_id = mock_agent.id
 
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
         mock_position_manager.get_account_value.return_value = mock_account_info
         mock_position_manager.get_total_exposure.return_value = 0.0
 
@@ -152,7 +152,7 @@ class TestRiskManager:
         # Mock account with only $500 withdrawable
         mock_account_info.withdrawable = 500.0
 
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
         mock_position_manager.get_account_value.return_value = mock_account_info
         mock_position_manager.get_total_exposure.return_value = 0.0
 
@@ -347,7 +347,7 @@ class TestRiskManager:
         """Test calculating max position size."""
         agent_id = mock_agent.id
 
-        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_agent
+        mock_session.get.return_value = mock_agent
         mock_position_manager.get_account_value.return_value = mock_account_info
 
         # Account value: $10,000, max position: 20%
@@ -357,7 +357,7 @@ class TestRiskManager:
 
     def test_get_max_position_size_agent_not_found(self, risk_manager, mock_session):
         """Test max position size when agent doesn't exist."""
-        mock_session.query.return_value.filter_by.return_value.first.return_value = None
+        mock_session.get.return_value = None
 
         max_size = risk_manager.get_max_position_size(uuid4())
 
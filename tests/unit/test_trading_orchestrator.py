@@ -71,7 +71,7 @@ class TestTradingOrchestrator:
     @pytest.fixture
     def mock_session(self):
         """Create mock database session."""
-        session = Mock()
+        session = MagicMock()
         return session
 
     @pytest.fixture
@@ -144,7 +144,7 @@ class TestTradingOrchestrator:
         decision.id = uuid4()
         decision.action = "HOLD"
 
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = [
+        mock_session.get.side_effect = [
             decision, mock_agent
         ]
 
@@ -158,7 +158,7 @@ class TestTradingOrchestrator:
 
     def test_execute_decision_not_found(self, orchestrator, mock_session):
         """Test executing non-existent decision."""
-        mock_session.query.return_value.filter_by.return_value.first.return_value = None
+        mock_session.get.return_value = None
 
         success, error = orchestrator.execute_decision(
             agent_id=uuid4(),
@@ -172,7 +172,7 @@ class TestTradingOrchestrator:
         self, orchestrator, mock_session, mock_decision_open_long
     ):
         """Test executing decision when agent doesn't exist."""
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = [
+        mock_session.get.side_effect = [
             mock_decision_open_long, None
         ]
 
@@ -189,7 +189,7 @@ class TestTradingOrchestrator:
         mock_risk_manager, mock_executor, mock_position_manager, mock_order_manager
     ):
         """Test successfully opening long position."""
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = [
+        mock_session.get.side_effect = [
             mock_decision_open_long, mock_agent
         ]
 
@@ -204,6 +204,12 @@ class TestTradingOrchestrator:
         # Verify risk validation was called
         mock_risk_manager.validate_trade.assert_called_once()
 
+        # Verify one exchange snapshot is shared by risk validation and sizing
+        mock_executor.snapshot.assert_called_once()
+        snapshot = mock_executor.snapshot.return_value
+        assert mock_risk_manager.validate_trade.call_args[1]["snapshot"] is snapshot
+        assert mock_position_manager.calculate_position_size.call_args[1]["snapshot"] is snapshot
+
         # Verify leverage was set
         mock_executor.update_leverage.assert_called_once_with(
             coin="BTC",
@@ -221,6 +227,16 @@ class TestTradingOrchestrator:
         assert call_args["side"] == OrderSide.LONG
         assert call_args["order_type"] == OrderType.MARKET
 
+        # Verify stop-loss and take-profit were placed
+        assert mock_executor.place_trigger_order.call_count == 2
+        sl_call, tp_call = mock_executor.place_trigger_order.call_args_list
+        assert sl_call[1] == {
+            "coin": "BTC", "is_buy": False, "is_tp": False, "reduce_only": True,
+            "size": Decimal("0.1"), "trigger_price": Decimal("48000")
+        }
+        assert tp_call[1]["is_tp"] is True
+        assert tp_call[1]["trigger_price"] == Decimal("52000")
+
     def test_execute_decision_open_short_success(
         self, orchestrator, mock_session, mock_agent, mock_risk_manager,
         mock_executor, mock_position_manager, mock_order_manager
@@ -235,7 +251,7 @@ class TestTradingOrchestrator:
         decision.stop_loss_price = None
         decision.take_profit_price = None
 
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = [
+        mock_session.get.side_effect = [
             decision, mock_agent
         ]
 
@@ -251,12 +267,15 @@ class TestTradingOrchestrator:
         call_args = mock_order_manager.execute_trade.call_args[1]
         assert call_args["side"] == OrderSide.SHORT
 
+        # No stop-loss / take-profit requested
+        mock_executor.place_trigger_order.assert_not_called()
+
     def test_execute_decision_risk_rejection(
         self, orchestrator, mock_session, mock_agent, mock_decision_open_long,
         mock_risk_manager
     ):
         """Test opening position rejected by risk manager."""
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = [
+        mock_session.get.side_effect = [
             mock_decision_open_long, mock_agent
         ]
 
@@ -277,7 +296,7 @@ class TestTradingOrchestrator:
         mock_executor
     ):
         """Test opening position when leverage update fails."""
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = [
+        mock_session.get.side_effect = [
             mock_decision_open_long, mock_agent
         ]
 
@@ -292,12 +311,31 @@ class TestTradingOrchestrator:
         assert success is False
         assert "Failed to set leverage" in error
 
+    def test_execute_decision_snapshot_failure_falls_back(
+        self, orchestrator, mock_session, mock_agent, mock_decision_open_long,
+        mock_risk_manager, mock_executor
+    ):
+        """Test opening position when the exchange snapshot cannot be fetched."""
+        mock_session.get.side_effect = [
+            mock_decision_open_long, mock_agent
+        ]
+        mock_executor.snapshot.side_effect = Exception("API error")
+
+        success, error = orchestrator.execute_decision(
+            agent_id=mock_agent.id,
+            decision_id=mock_decision_open_long.id
+        )
+
+        assert success is True
+        assert error is None
+        assert mock_risk_manager.validate_trade.call_args[1]["snapshot"] is None
+
     def test_execute_decision_trade_execution_failure(
         self, orchestrator, mock_session, mock_agent, mock_decision_open_long,
         mock_order_manager
     ):
         """Test opening position when trade execution fails."""
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = [
+        mock_session.get.side_effect = [
             mock_decision_open_long, mock_agent
         ]
 
@@ -332,7 +370,7 @@ class TestTradingOrchestrator:
 
         mock_position_manager.get_current_positions.return_value = [position]
 
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = [
+        mock_session.get.side_effect = [
             mock_decision_close, mock_agent
         ]
 
@@ -371,7 +409,7 @@ class TestTradingOrchestrator:
 
         mock_position_manager.get_current_positions.return_value = [position]
 
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = [
+        mock_session.get.side_effect = [
             mock_decision_close, mock_agent
         ]
 
@@ -393,7 +431,7 @@ class TestTradingOrchestrator:
         """Test closing position when none exists."""
         mock_position_manager.get_current_positions.return_value = []
 
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = [
+        mock_session.get.side_effect = [
             mock_decision_close, mock_agent
         ]
 
@@ -425,7 +463,7 @@ class TestTradingOrchestrator:
         mock_position_manager.get_current_positions.return_value = [position]
         mock_executor.place_order.return_value = (False, None, "Insufficient margin")
 
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = [
+        mock_session.get.side_effect = [
             mock_decision_close, mock_agent
         ]
 
@@ -445,7 +483,7 @@ class TestTradingOrchestrator:
         decision.id = uuid4()
         decision.action = "INVALID_ACTION"
 
-        mock_session.query.return_value.filter_by.return_value.first.side_effect = [
+        mock_session.get.side_effect = [
             decision, mock_agent
         ]
 
@@ -481,3 +519,18 @@ class TestTradingOrchestrator:
         repr_str = repr(orchestrator)
         assert "TradingOrchestrator" in repr_str
         assert "executors=" in repr_str
+
+    def test_trigger_templates_are_cached(self, orchestrator, mock_executor):
+        """Test trigger order callables are built once per (executor, coin, side, kind)."""
+        sl_btc = orchestrator._get_trigger(mock_executor, "BTC", False, False)
+
+        assert orchestrator._get_trigger(mock_executor, "BTC", False, False) is sl_btc
+        assert orchestrator._get_trigger(mock_executor, "BTC", False, True) is not sl_btc
+        assert orchestrator._get_trigger(mock_executor, "ETH", False, False) is not sl_btc
+
+    def test_uses_slots(self, orchestrator):
+        """Test orchestrator attributes are slot-based."""
+        assert not hasattr(orchestrator, "__dict__")
+
+        with pytest.raises(AttributeError):
+            orchestrator.unknown_attribute = 1